@@ -0,0 +1,187 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the M3U Editor. Invoked by build_app.py; build
+# variants are selected through the same environment variables it documents.
+import os
+import sys
+import ast
+import json
+import hashlib
+import platform
+
+is_windows = sys.platform == 'win32'
+is_macos = sys.platform == 'darwin'
+
+# onefile re-extracts the whole archive to a temp dir on every launch,
+# onedir runs in place and starts several times faster.
+onefile = bool(os.environ.get('BUILD_ONEFILE'))
+
+# Ship modules as loose .pyc files instead of a single PYZ archive, which
+# can page in faster on a cold cache. Opt-in until benchmarked per platform.
+noarchive = bool(os.environ.get('BUILD_NOARCHIVE'))
+
+# UPX is only used on Windows: it breaks codesigning on macOS and does not
+# support arm64. The excluded DLLs are known to break when packed.
+use_upx = is_windows and platform.machine().lower() not in ('arm64', 'aarch64')
+upx_exclude = ['vcruntime140.dll', 'python3*.dll', 'Qt6*.dll']
+
+# Strip symbol tables from the bundled ELF/Mach-O libraries (Qt alone carries tens of MB)
+strip = not is_windows
+
+# Keep modules the app never imports out of the bundle
+excludes = ['tkinter', 'unittest', 'test', 'pydoc_data', 'pytest', 'numpy.tests',
+            'PIL.ImageTk', 'setuptools', 'pip', 'wheel', 'distutils']
+
+def plugin_name(source, default):
+    """Reads PLUGIN_NAME without importing the plugin."""
+    for node in ast.parse(source).body:
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                and any(isinstance(t, ast.Name) and t.id == 'PLUGIN_NAME' for t in node.targets)):
+            return str(node.value.value)
+    return default
+
+datas = []
+if os.path.isdir('plugins'):
+    # The app lists plugins from this manifest at startup and only imports
+    # a plugin the first time it is run.
+    manifest = []
+    with os.scandir('plugins') as it:
+        plugin_files = sorted((e for e in it if e.is_file(follow_symlinks=False)), key=lambda e: e.name)
+    for entry in plugin_files:
+        datas.append((entry.path, 'plugins'))
+        if entry.name.endswith('.py') and not entry.name.startswith('__'):
+            with open(entry.path, 'rb') as f:
+                source = f.read()
+            manifest.append({
+                'name': plugin_name(source, os.path.splitext(entry.name)[0]),
+                'file': entry.name,
+                'sha256': hashlib.sha256(source).hexdigest(),
+            })
+    os.makedirs(workpath, exist_ok=True)
+    manifest_path = os.path.join(workpath, 'manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    datas.append((manifest_path, 'plugins'))
+
+if is_windows:
+    icon = 'icon.ico'
+elif is_macos:
+    icon = 'icon.icns'
+else:
+    icon = None
+
+a = Analysis(
+    ['m3u_editor.py'],
+    pathex=['.'],
+    binaries=[],
+    datas=datas,
+    # Freeze the helper module into the PYZ as bytecode instead of shipping its source.
+    # The others are loaded by name at runtime: qrcode's default PIL image factory
+    # and the PNG codec PIL imports on save. List them explicitly rather than
+    # collecting whole packages.
+    hiddenimports=['performance_utils', 'qrcode.image.pil', 'PIL.PngImagePlugin'],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=noarchive,
+    # Strip asserts and docstrings from the frozen bytecode (-OO)
+    optimize=2,
+)
+# The PYZ stays zlib-compressed: entries are inflated one module at a time on
+# import, and its reader is frozen into the bootloader, so a different codec
+# cannot be swapped in. BUILD_NOARCHIVE skips the compression entirely.
+pyz = PYZ(a.pure)
+
+# Show a splash image while the bootloader unpacks and imports Qt. PyInstaller
+# does not support splash screens on macOS; the app closes it once the window is up.
+# Splash needs Tcl/Tk in the build interpreter and exits the build without it,
+# so builds on machines without tkinter just go without the splash.
+splash = None
+if not is_macos and os.path.exists('splash.png'):
+    try:
+        import tkinter  # noqa: F401
+    except ImportError:
+        print("Warning: tkinter is not available, building without a splash screen")
+    else:
+        try:
+            splash = Splash(
+                'splash.png',
+                binaries=a.binaries,
+                datas=a.datas,
+                text_pos=(16, 220),
+                text_size=10,
+                text_color='#cdd6f4',
+            )
+        except SystemExit as e:
+            print(f"Warning: splash screen unavailable ({e}), building without it")
+splash_targets = [splash] if splash else []
+splash_binaries = splash.binaries if splash else []
+
+# Run the frozen interpreter at -OO to match the bytecode built with optimize=2
+# (one 'O' entry per level, as pyi-makespec writes them), with a fixed hash seed
+runtime_options = [('O', None, 'OPTION'), ('O', None, 'OPTION'), ('hash_seed=0', None, 'OPTION')]
+
+if onefile:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        *splash_targets,
+        splash_binaries,
+        a.binaries,
+        a.datas,
+        runtime_options,
+        name='M3UEditor',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=strip,
+        upx=use_upx,
+        upx_exclude=upx_exclude,
+        runtime_tmpdir=None,
+        console=False,  # Don't show console
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=icon,
+    )
+    bundle_target = exe
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        *splash_targets,
+        runtime_options,
+        exclude_binaries=True,
+        name='M3UEditor',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=strip,
+        upx=use_upx,
+        console=False,  # Don't show console
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=icon,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        splash_binaries,
+        strip=strip,
+        upx=use_upx,
+        upx_exclude=upx_exclude,
+        name='M3UEditor',
+    )
+    bundle_target = coll
+
+if is_macos:
+    app = BUNDLE(
+        bundle_target,
+        name='M3UEditor.app',
+        icon=icon,
+        bundle_identifier='com.opensource.m3ueditor',
+    )
@@ -1,57 +1,211 @@
-import PyInstaller.__main__
 import sys
 import os
-import shutil
+import subprocess
+import tempfile
+import marshal
+import hashlib
+import pathlib
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+
+def strip_sources(root):
+    """Removes .py files from the bundle when a loadable flat .pyc sits next to them."""
+    removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith('.py'):
+                continue
+            source = os.path.join(dirpath, filename)
+            # Only a flat foo.pyc can be imported without its source;
+            # __pycache__ entries are ignored once foo.py is gone.
+            compiled = source + 'c'
+            if not os.path.exists(compiled):
+                continue
+            try:
+                with open(compiled, 'rb') as f:
+                    f.seek(16)  # Skip the pyc header
+                    marshal.load(f)
+            except Exception as e:
+                print(f"Keeping {source}: unreadable bytecode ({e})")
+                continue
+            os.remove(source)
+            removed += 1
+    if removed:
+        print(f"Removed {removed} source files shadowed by bytecode.")
+
+def audit_duplicates(root, hardlink=False):
+    """Warns about identical files bundled more than once under different subpaths.
+
+    With hardlink set, every copy after the first is replaced by a hardlink to it.
+    """
+    by_name = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if not os.path.islink(path):
+                by_name.setdefault(filename, []).append(path)
+
+    wasted = 0
+    for filename, paths in sorted(by_name.items()):
+        if len(paths) < 2:
+            continue
+        by_digest = {}
+        for path in paths:
+            with open(path, 'rb') as f:
+                digest = hashlib.blake2b(f.read()).hexdigest()
+            by_digest.setdefault(digest, []).append(path)
+        for copies in by_digest.values():
+            original = copies[0]
+            original_stat = os.stat(original)
+            # Copies already hardlinked to the original cost nothing
+            copies = [p for p in copies[1:] if not os.path.samestat(os.stat(p), original_stat)]
+            if not copies:
+                continue
+            size = original_stat.st_size
+            wasted += size * len(copies)
+            print(f"Warning: {filename} is bundled {len(copies) + 1} times ({size / 1024:.0f} KB each):")
+            for path in [original, *copies]:
+                print(f"  {os.path.relpath(path, root)}")
+            if hardlink:
+                for path in copies:
+                    os.remove(path)
+                    os.link(original, path)
+    if wasted:
+        action = "reclaimed by hardlinking" if hardlink else "duplicated"
+        print(f"{wasted / (1024 * 1024):.1f} MB {action}.")
+
+def find_upx():
+    """Returns the directory containing UPX, or None if unavailable or unsupported."""
+    # Only needed for Windows builds, so imported here rather than at startup
+    import platform
+    import shutil
+    if platform.machine().lower() in ('arm64', 'aarch64'):
+        return None
+    bundled_upx = SCRIPT_DIR / 'upx'
+    if bundled_upx.is_dir():
+        return str(bundled_upx)
+    upx_exe = shutil.which('upx')
+    return os.path.dirname(upx_exe) if upx_exe else None
 
 def build():
     print("Starting build process...")
-    
+
+    # Make successive builds byte-identical: pin embedded timestamps to the last
+    # commit (compileall also switches to hash-based .pyc files when this is set)
+    # and fix the hash seed so set/dict ordering in generated data is stable.
+    if 'SOURCE_DATE_EPOCH' not in os.environ:
+        try:
+            commit_time = subprocess.check_output(['git', 'log', '-1', '--pretty=%ct'], cwd=SCRIPT_DIR, text=True).strip()
+            os.environ['SOURCE_DATE_EPOCH'] = str(int(commit_time))
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            print("Warning: git unavailable, build timestamps will not be reproducible")
+    os.environ['PYTHONHASHSEED'] = '0'
+
     # Determine OS
     is_windows = sys.platform == 'win32'
     is_macos = sys.platform == 'darwin'
     
-    # Base arguments
-    args = [
-        'm3u_editor.py',
-        '--name=M3UEditor',
-        '--windowed',  # Don't show console
-        '--noconfirm',
-        '--clean',
-        # Include helper module
-        '--add-data=performance_utils.py:.',
-    ]
-
-    # Platform specific settings
-    if is_windows:
-        args.append('--icon=icon.ico') # Assuming you might have an icon
-    elif is_macos:
-        args.append('--icon=icon.icns')
-        # macOS specific bundle identifier
-        args.append('--osx-bundle-identifier=com.opensource.m3ueditor')
-
-    # Add plugins folder if it exists
-    if os.path.exists('plugins'):
-        sep = ';' if is_windows else ':'
-        args.append(f'--add-data=plugins{sep}plugins')
+    # Packaging options live in M3UEditor.spec, which reads the same
+    # BUILD_* environment variables; only per-run flags are passed here.
+    onefile = bool(os.environ.get('BUILD_ONEFILE'))
+    args = ['M3UEditor.spec', '--noconfirm']
+
+    # Keep PyInstaller's many small intermediate writes on a fast volume;
+    # the workpath persists so incremental builds can reuse it.
+    if sys.platform.startswith('linux') and os.path.isdir('/dev/shm'):
+        workpath = '/dev/shm/m3ue-build'
+    else:
+        workpath = os.path.join(tempfile.gettempdir(), 'm3ue-build')
+    dist_folder = SCRIPT_DIR / 'dist'
+    args += ['--workpath', workpath, '--distpath', str(dist_folder)]
+
+    # Reuse the PyInstaller cache between builds unless a full rebuild is requested
+    if os.environ.get('CI_FULL_REBUILD'):
+        args.append('--clean')
+
+    # Point PyInstaller at UPX for the Windows build (the spec decides where it applies)
+    upx_dir = find_upx() if is_windows else None
+    if upx_dir:
+        args += ['--upx-dir', upx_dir]
+
+    # Skip the build entirely when none of its inputs changed since the last success.
+    # The spec also bundles the plugins and the splash image, and this script
+    # post-processes the bundle, so they count too.
+    key_inputs = [SCRIPT_DIR / f for f in ('m3u_editor.py', 'performance_utils.py', 'M3UEditor.spec',
+                                           'requirements.txt', 'splash.png', 'build_app.py')]
+    plugins_src = SCRIPT_DIR / 'plugins'
+    if plugins_src.is_dir():
+        # Same selection as the spec: every file directly inside plugins/
+        key_inputs += sorted(p for p in plugins_src.iterdir() if p.is_file() and not p.is_symlink())
+    hasher = hashlib.blake2b()
+    for path in key_inputs:
+        if path.exists():
+            # Include the path so renaming or removing a plugin changes the key as well
+            hasher.update(str(path.relative_to(SCRIPT_DIR)).encode())
+            hasher.update(path.read_bytes())
+    build_env = {k: v for k, v in os.environ.items() if k.startswith('BUILD_')}
+    hasher.update(repr((sorted(args), sorted(build_env.items()))).encode())
+    build_key = hasher.hexdigest()
+
+    key_file = os.path.join(dist_folder, '.build_key')
+    if is_macos:
+        output_path = os.path.join(dist_folder, 'M3UEditor.app')
+    elif onefile:
+        output_path = os.path.join(dist_folder, 'M3UEditor.exe' if is_windows else 'M3UEditor')
+    else:
+        output_path = os.path.join(dist_folder, 'M3UEditor')
+    if not os.environ.get('CI_FULL_REBUILD') and os.path.exists(output_path) and os.path.exists(key_file):
+        with open(key_file, 'r') as f:
+            if f.read().strip() == build_key:
+                print(f"Up to date: {output_path}")
+                return
 
     # Run PyInstaller
     try:
-        PyInstaller.__main__.run(args)
+        # Run under -OO so any module PyInstaller compiles itself is optimized too
+        subprocess.run([sys.executable, '-OO', '-m', 'PyInstaller', *args], check=True, cwd=SCRIPT_DIR)
         print("Build complete.")
+
+        pyz_path = os.path.join(workpath, 'M3UEditor', 'PYZ-00.pyz')
+        if os.path.exists(pyz_path):
+            print(f"PYZ archive size: {os.path.getsize(pyz_path) / 1024:.0f} KB")
+
+        internal_dir = os.path.join(dist_folder, 'M3UEditor', '_internal')
+        # Pre-compile bundled plugins next to their sources (-b) at -OO so they are
+        # never compiled at runtime, then drop the sources they replace.
+        plugins_dir = os.path.join(internal_dir, 'plugins')
+        if os.path.isdir(plugins_dir):
+            subprocess.run([sys.executable, '-OO', '-m', 'compileall', '-q', '-b', '-f', plugins_dir], check=True)
+        if os.path.isdir(internal_dir):
+            strip_sources(internal_dir)
+
+        # Surface binaries (Qt, python3*, libcrypto...) collected under several
+        # subpaths; on POSIX the extra copies are turned into hardlinks.
+        bundle_dir = os.path.join(dist_folder, 'M3UEditor')
+        if not onefile and os.path.isdir(bundle_dir):
+            audit_duplicates(bundle_dir, hardlink=not is_windows)
+
+        with open(key_file, 'w') as f:
+            f.write(build_key)
         
         # Post-build instructions
-        dist_folder = os.path.join(os.getcwd(), 'dist')
         if is_macos:
             print(f"App bundle located at: {os.path.join(dist_folder, 'M3UEditor.app')}")
+            print(f"Executable located at: {os.path.join(dist_folder, 'M3UEditor.app', 'Contents', 'MacOS', 'M3UEditor')}")
+        elif onefile:
+            exe_name = 'M3UEditor.exe' if is_windows else 'M3UEditor'
+            print(f"Executable located at: {os.path.join(dist_folder, exe_name)}")
         elif is_windows:
-            print(f"Executable located at: {os.path.join(dist_folder, 'M3UEditor', 'M3UEditor.exe')}")
+            exe_path = os.path.join(dist_folder, 'M3UEditor', 'M3UEditor.exe')
+            print(f"Executable located at: {exe_path}")
+            if os.path.exists(exe_path):
+                size_mb = os.path.getsize(exe_path) / (1024 * 1024)
+                print(f"Executable size: {size_mb:.1f} MB ({'UPX compressed' if upx_dir else 'uncompressed'})")
         else:
-            print(f"Executable located at: {os.path.join(dist_folder, 'M3UEditor')}")
+            print(f"Executable located at: {os.path.join(dist_folder, 'M3UEditor', 'M3UEditor')}")
             
     except Exception as e:
         print(f"Build failed: {e}")
 
 if __name__ == "__main__":
-    # Ensure we are in the script directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
     build()
\ No newline at end of file
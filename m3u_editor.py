@@ -25,8 +25,14 @@ import random
 import json
 import http.cookiejar
 import importlib.util
+import ast
 import warnings
 import io
+import itertools
+from operator import attrgetter
+from contextlib import contextmanager, ExitStack
+from collections import defaultdict, Counter
+import threading
 import webbrowser
 
 try:
@@ -59,6 +65,13 @@ try:
 except ImportError:
     HAS_KEYBOARD = False
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
 from dataclasses import dataclass, field
 
 # Suppress urllib3 SSL warnings on macOS/LibreSSL
@@ -83,7 +96,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QUrl, QPropertyAnimation, 
                           QEasingCurve, QAbstractAnimation, QSettings, QAbstractTableModel,
                           QSortFilterProxyModel, QThreadPool, QRunnable, QObject, QByteArray, QSize, QTimer,
-                          QDateTime, QPoint, QRect, QRectF, QTime, QItemSelection, QItemSelectionModel)
+                          QDateTime, QPoint, QRect, QRectF, QTime, QItemSelection, QItemSelectionModel,
+                          QModelIndex, QSignalBlocker)
 from PyQt6.QtGui import QColor, QPalette, QAction, QPixmap, QIcon, QImage, QStandardItemModel, QStandardItem, QPainter, QBrush
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink, QMediaMetaData
 from PyQt6.QtMultimediaWidgets import QVideoWidget
@@ -110,7 +124,37 @@ sys.excepthook = exception_hook
 # Data Model
 # -----------------------------------------------------------------------------
 
-@dataclass
+# Attribute shape -> %-template for M3UEntry.to_m3u_string
+_M3U_TEMPLATES = {}
+
+def _build_m3u_template(shape):
+    """Builds the EXTINF/URL template for one combination of present fields.
+
+    Attributes keep the order the editor has always written them in.
+    """
+    has_group, has_tvg_id, has_logo, has_chno, favorite, has_health, locked, has_ua = shape
+    parts = ['#EXTINF:%s']
+    if has_group:
+        parts.append(' group-title="%s"')
+    if has_tvg_id:
+        parts.append(' tvg-id="%s"')
+    if has_logo:
+        parts.append(' tvg-logo="%s"')
+    if has_chno:
+        parts.append(' tvg-chno="%s"')
+    if favorite:
+        parts.append(' tvg-fav="1"')
+    if has_health:
+        parts.append(' tvg-health="%s"')
+    if locked:
+        parts.append(' tvg-locked="1"')
+    parts.append(',%s')
+    if has_ua:
+        parts.append('\n#EXTVLCOPT:http-user-agent=%s')
+    parts.append('\n%s')
+    return ''.join(parts)
+
+@dataclass(slots=True)
 class M3UEntry:
     """Represents a single channel/stream in the playlist."""
     name: str
@@ -126,40 +170,48 @@ class M3UEntry:
     locked: bool = False
     validation_history: List[Any] = field(default_factory=list) # List of (timestamp, is_valid)
     raw_extinf: str = ""  # Keep original attributes to preserve unedited data
+    # (serialized fields, text) from the last to_m3u_string call
+    _m3u_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (searched fields, lowercased copies) from the last search_keys call
+    _search_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def search_keys(self) -> tuple:
+        """Lowercased (name, group, url, tvg_id) for case-insensitive search, cached until they change."""
+        source = (self.name, self.group, self.url, self.tvg_id)
+        cached = self._search_cache
+        if cached is not None and cached[0] == source:
+            return cached[1]
+        keys = tuple(v.lower() for v in source)
+        self._search_cache = (source, keys)
+        return keys
 
     def to_m3u_string(self) -> str:
         """Reconstructs the #EXTINF line and URL line."""
-        # We rebuild the EXTINF line based on current properties
-        # Basic format: #EXTINF:-1 group-title="Group" tvg-logo="Logo",Name
-        
-        attributes = []
-        if self.group:
-            attributes.append(f'group-title="{self.group}"')
-        if self.tvg_id:
-            attributes.append(f'tvg-id="{self.tvg_id}"')
-        if self.logo:
-            attributes.append(f'tvg-logo="{self.logo}"')
-        if self.tvg_chno:
-            attributes.append(f'tvg-chno="{self.tvg_chno}"')
-        if self.favorite:
-            attributes.append('tvg-fav="1"')
-        if self.health_status:
-            attributes.append(f'tvg-health="{self.health_status}"')
-        if self.locked:
-            attributes.append('tvg-locked="1"')
-        
-        # You can add more specific tvg- tags here if needed
-        attr_str = " ".join(attributes)
-        
-        # If we have attributes, prepend a space
-        if attr_str:
-            attr_str = " " + attr_str
-            
-        lines = [f'#EXTINF:{self.duration}{attr_str},{self.name}']
-        if self.user_agent:
-            lines.append(f'#EXTVLCOPT:http-user-agent={self.user_agent}')
-        lines.append(self.url)
-        return "\n".join(lines)
+        # Entries are edited in place all over the app, so rather than hooking every
+        # assignment the cached text is reused only while its source fields are unchanged
+        key = (self.duration, self.group, self.tvg_id, self.logo, self.tvg_chno, self.favorite,
+               self.health_status, self.locked, self.name, self.user_agent, self.url)
+        cached = self._m3u_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Most entries in a playlist share the same combination of present
+        # attributes, so the line layout is built once per shape and reused
+        duration, group, tvg_id, logo, tvg_chno, favorite, health_status, locked, name, user_agent, url = key
+        shape = (bool(group), bool(tvg_id), bool(logo), bool(tvg_chno), bool(favorite),
+                 bool(health_status), bool(locked), bool(user_agent))
+        template = _M3U_TEMPLATES.get(shape)
+        if template is None:
+            template = _M3U_TEMPLATES[shape] = _build_m3u_template(shape)
+        values = [duration]
+        values.extend(v for v in (group, tvg_id, logo, tvg_chno, health_status) if v)
+        values.append(name)
+        if user_agent:
+            values.append(user_agent)
+        values.append(url)
+        text = template % tuple(values)
+        self._m3u_cache = (key, text)
+        return text
 
 @dataclass
 class RecordingTask:
@@ -178,28 +230,33 @@ class RecordingTask:
 
 class M3UParser:
     """Handles reading and writing M3U files."""
+
+    _EPG_URL_RE = re.compile(r'(?:url-tvg|x-tvg-url)="([^"]*)"', re.IGNORECASE)
     
     @staticmethod
     def parse_lines(lines: Iterable[str]) -> List[M3UEntry]:
         logging.debug("Starting to parse lines...")
-        raw_entries = FastM3UParser.parse_lines(list(lines))
+        raw_entries = FastM3UParser.parse_lines(lines)
         entries = []
+        # Hoist the per-entry lookups out of the loop; it runs once per channel
+        append = entries.append
+        make_entry = M3UEntry
         for e in raw_entries:
-            entry = M3UEntry(
-                name=e.get("name", "Unknown"),
-                url=e.get("url", ""),
-                group=e.get("group", ""),
-                logo=e.get("logo", e.get("tvg_logo", "")),
-                tvg_id=e.get("tvg_id", ""),
-                tvg_chno=e.get("tvg_chno", ""),
-                duration=e.get("duration", "-1"),
-                favorite=(e.get("tvg_fav", "0") == "1"),
-                health_status=e.get("tvg_health", ""),
-                locked=(e.get("tvg_locked", "0") == "1"),
-                user_agent=e.get("user_agent", ""),
-                raw_extinf=e.get("raw_extinf", "")
-            )
-            entries.append(entry)
+            get = e.get
+            append(make_entry(
+                name=get("name", "Unknown"),
+                url=get("url", ""),
+                group=get("group", ""),
+                logo=get("logo", get("tvg_logo", "")),
+                tvg_id=get("tvg_id", ""),
+                tvg_chno=get("tvg_chno", ""),
+                duration=get("duration", "-1"),
+                favorite=(get("tvg_fav") == "1"),
+                health_status=get("tvg_health", ""),
+                locked=(get("tvg_locked") == "1"),
+                user_agent=get("user_agent", ""),
+                raw_extinf=get("raw_extinf", "")
+            ))
         logging.debug(f"Finished parsing. Found {len(entries)} entries.")
         return entries
 
@@ -207,7 +264,8 @@ class M3UParser:
     @staticmethod
     def parse_file(filepath: str) -> List[M3UEntry]:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            # Stream the file through the parser instead of materializing every line
+            with open(filepath, 'r', encoding='utf-8', errors='ignore', buffering=1 << 20) as f:
                 return M3UParser.parse_lines(f)
         except Exception as e:
             logging.error(f"Error parsing file: {e}", exc_info=True)
@@ -216,10 +274,12 @@ class M3UParser:
     @staticmethod
     def save_file(filepath: str, entries: List[M3UEntry], encoding: str = 'utf-8'):
         try:
-            with open(filepath, 'w', encoding=encoding) as f:
-                f.write("#EXTM3U\n")
-                for entry in entries:
-                    f.write(entry.to_m3u_string() + "\n")
+            # Build the document once and hand it to a large buffer in a single write
+            parts = ["#EXTM3U"]
+            parts.extend(entry.to_m3u_string() for entry in entries)
+            parts.append("")
+            with open(filepath, 'w', encoding=encoding, buffering=1 << 20) as f:
+                f.write("\n".join(parts))
         except Exception as e:
             raise e
 
@@ -228,12 +288,36 @@ class M3UParser:
         info = {}
         for line in lines:
             if line.startswith("#EXTM3U"):
-                match = re.search(r'(?:url-tvg|x-tvg-url)="([^"]*)"', line, re.IGNORECASE)
+                match = M3UParser._EPG_URL_RE.search(line)
                 if match:
                     info['url-tvg'] = match.group(1)
                 break
         return info
 
+class PlaylistLoaderSignals(QObject):
+    finished = pyqtSignal(str, list, str) # url, list of M3UEntry, epg_url
+    error = pyqtSignal(str)
+
+class PlaylistLoaderWorker(QRunnable):
+    """Worker to download and parse a remote playlist off the UI thread."""
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.signals = PlaylistLoaderSignals()
+
+    def run(self):
+        try:
+            with urllib.request.urlopen(self.url, timeout=30) as response:
+                # Parse while downloading; only the header lines are kept aside for the EPG URL
+                lines = io.TextIOWrapper(response, encoding='utf-8', errors='ignore')
+                head = list(itertools.islice(lines, 5))
+                entries = M3UParser.parse_lines(itertools.chain(head, lines))
+            epg_url = M3UParser.extract_header_info(head).get('url-tvg', "")
+            self.signals.finished.emit(self.url, entries, epg_url)
+        except Exception as e:
+            logging.error(f"Failed to load URL: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
+
 class GitVersionControl:
     """Manages a local git repository for playlist versioning."""
     def __init__(self, base_path):
@@ -290,26 +374,53 @@ class ValidationSignals(QObject):
 
 class ValidationWorker(QRunnable):
     """Worker runnable to check a single stream URL."""
-    def __init__(self, row_index, url, user_agent):
+    # Shared by all workers so checks against the same host reuse TCP/TLS connections
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, row_index, url, user_agent, cancel_event=None):
         super().__init__()
         self.row_index = row_index # Source row index
         self.url = url
         self.user_agent = user_agent
+        self.cancel_event = cancel_event # Shared by one validation run; set when it is stopped
         self.signals = ValidationSignals()
 
+    def is_cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
     def run(self):
+        if self.is_cancelled():
+            return
         try:
             is_valid, msg = self.check_url(self.url, self.user_agent)
+            if self.is_cancelled():
+                return
             self.signals.result.emit(self.row_index, is_valid, msg)
         except Exception as e:
             logging.error(f"ValidationWorker failed for row {self.row_index}: {e}", exc_info=True)
         finally:
-            self.signals.finished.emit()
+            # A stopped run has already been reset by the window; stay silent
+            if not self.is_cancelled():
+                self.signals.finished.emit()
+
+    @classmethod
+    def get_session(cls):
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._session = session
+            return cls._session
 
     def check_url(self, url, user_agent=None):
         headers = {
             'User-Agent': user_agent if user_agent else 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        if HAS_REQUESTS:
+            return self.check_url_pooled(url, headers)
         try:
             req = urllib.request.Request(url, headers=headers, method='HEAD')
             # 5-second timeout
@@ -330,6 +441,24 @@ class ValidationWorker(QRunnable):
         except Exception as e:
             return False, f"Error: {str(e)}"
 
+    def check_url_pooled(self, url, headers):
+        session = self.get_session()
+        # Separate connect/read timeouts so an unreachable host fails fast
+        timeout = (2, 3)
+        try:
+            with session.head(url, headers=headers, timeout=timeout, allow_redirects=True) as response:
+                status = response.status_code
+            if status == 405: # Method Not Allowed, try GET without downloading the body
+                with session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                    if 200 <= response.status_code < 400:
+                        return True, f"OK ({response.status_code})"
+                return False, f"HTTP {status}"
+            if 200 <= status < 400:
+                return True, f"OK ({status})"
+            return False, f"HTTP {status}"
+        except Exception as e:
+            return False, f"Error: {str(e)}"
+
 class LogoSignals(QObject):
     result = pyqtSignal(str, bytes) # url, data
 
@@ -743,16 +872,46 @@ class RepairWorker(QRunnable):
             
         return None
 
+@contextmanager
+def signals_blocked(*objects):
+    """Blocks the signals of every given object until the block exits, even on errors."""
+    with ExitStack() as stack:
+        for obj in objects:
+            stack.enter_context(QSignalBlocker(obj))
+        yield
+
+def contiguous_runs(rows):
+    """Groups sorted row numbers into (first, last) runs of consecutive rows."""
+    run_start = prev = None
+    for row in rows:
+        if prev is not None and row == prev + 1:
+            prev = row
+            continue
+        if run_start is not None:
+            yield run_start, prev
+        run_start = prev = row
+    if run_start is not None:
+        yield run_start, prev
+
 class PlaylistModel(QAbstractTableModel):
     """Model to handle playlist data efficiently."""
     request_logo = pyqtSignal(str)
 
+    # (valid, invalid) row backgrounds, keyed by dark mode
+    VALIDATION_BRUSHES = {
+        True: (QBrush(QColor("#1b5e20")), QBrush(QColor("#b71c1c"))),  # Darker Green/Red
+        False: (QBrush(QColor("#c8e6c9")), QBrush(QColor("#ffcdd2"))),  # Light Green/Red
+    }
+
     def __init__(self, entries=None, parent=None):
         super().__init__(parent)
         self.entries = entries or []
         self.headers = ["Group", "Name", "URL", "Security", "Language"]
-        self.validation_data = {}  # id(entry) -> (color, msg, is_valid)
+        self.validation_data = {}  # id(entry) -> (msg, is_valid)
+        # Backgrounds for validated rows, shared by every row rather than stored per entry
+        self.valid_brush, self.invalid_brush = self.VALIDATION_BRUSHES[True]
         self.highlight_data = {}   # id(entry) -> color
+        self.highlight_rows = set()  # Source rows passed to the last set_highlights call
         self.logo_cache = {}       # url -> QPixmap
         self.pending_logos = set() # urls currently fetching
         self.logo_loader = None # Will be set by window
@@ -782,15 +941,19 @@ class PlaylistModel(QAbstractTableModel):
             return None
         
         entry = self.entries[row]
+        # data() runs for every visible cell and role on each repaint, so look
+        # the column and entry key up once
+        col = index.column()
+        key = id(entry)
         
         if role == Qt.ItemDataRole.DisplayRole:
-            if index.column() == 0: return entry.group
-            if index.column() == 1: return f"★ {entry.name}" if entry.favorite else entry.name
-            if index.column() == 2: return entry.url
-            if index.column() == 3:
-                audit = self.security_data.get(id(entry))
+            if col == 0: return entry.group
+            if col == 1: return f"★ {entry.name}" if entry.favorite else entry.name
+            if col == 2: return entry.url
+            if col == 3:
+                audit = self.security_data.get(key)
                 return audit["summary"] if audit else "Not Audited"
-            if index.column() == 4:
+            if col == 4:
                 # Detect language dynamically
                 name_lower = entry.name.lower()
                 for lang, patterns in LANGUAGE_PATTERNS.items():
@@ -799,24 +962,44 @@ class PlaylistModel(QAbstractTableModel):
                             return lang
                 return "Unknown"
             
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            validation = self.validation_data.get(key)
+            if validation is not None:
+                return self.valid_brush if validation[1] else self.invalid_brush
+            return self.highlight_data.get(key)
+            
+        elif role == Qt.ItemDataRole.DecorationRole:
+            # Show logo in Name column (1) or all columns if needed
+            if col == 1 and entry.logo:
+                logo = entry.logo
+                pixmap = self.logo_cache.get(logo)
+                if pixmap is not None:
+                    return pixmap
+                if logo not in self.pending_logos:
+                    self.pending_logos.add(logo)
+                    if self.logo_loader:
+                        self.logo_loader.request_logo(logo)
+            
+            elif col == 3:
+                audit = self.security_data.get(key)
+                if audit:
+                    icon_name = QStyle.StandardPixmap.SP_DialogApplyButton if audit["is_secure"] else QStyle.StandardPixmap.SP_MessageBoxWarning
+                    return QApplication.style().standardIcon(icon_name)
+            return None
+            
         elif role == Qt.ItemDataRole.UserRole:
             return entry
 
         elif role == Qt.ItemDataRole.EditRole:
             # Return clean name for editing
-            if index.column() == 1: return entry.name
+            if col == 1: return entry.name
             
         elif role == Qt.ItemDataRole.UserRole + 1:
-            return self.validation_data.get(id(entry), (None, None, None))[2]
-            
-        elif role == Qt.ItemDataRole.BackgroundRole:
-            if id(entry) in self.validation_data:
-                return self.validation_data[id(entry)][0]
-            return self.highlight_data.get(id(entry))
+            return self.validation_data.get(key, (None, None))[1]
             
         elif role == Qt.ItemDataRole.ToolTipRole:
-            val_msg = self.validation_data.get(id(entry), (None, None, None))[1]
-            audit = self.security_data.get(id(entry))
+            val_msg = self.validation_data.get(key, (None, None))[0]
+            audit = self.security_data.get(key)
             if audit:
                 audit_msg = (f"Security Audit:\n"
                              f"- SSL: {audit['ssl_valid']}\n"
@@ -826,23 +1009,6 @@ class PlaylistModel(QAbstractTableModel):
                 return f"{val_msg}\n\n{audit_msg}" if val_msg else audit_msg
             return val_msg
             
-        elif role == Qt.ItemDataRole.DecorationRole:
-            # Show logo in Name column (1) or all columns if needed
-            if index.column() == 1 and entry.logo:
-                if entry.logo in self.logo_cache:
-                    return self.logo_cache[entry.logo]
-                elif entry.logo not in self.pending_logos:
-                    self.pending_logos.add(entry.logo)
-                    if self.logo_loader:
-                        self.logo_loader.request_logo(entry.logo)
-            
-            if index.column() == 3:
-                audit = self.security_data.get(id(entry))
-                if audit:
-                    icon_name = QStyle.StandardPixmap.SP_DialogApplyButton if audit["is_secure"] else QStyle.StandardPixmap.SP_MessageBoxWarning
-                    return QApplication.style().standardIcon(icon_name)
-            return None
-            
         return None
 
     def headerData(self, section, orientation, role):
@@ -850,19 +1016,99 @@ class PlaylistModel(QAbstractTableModel):
             return self.headers[section]
         return None
 
+    def append_entries(self, new_entries):
+        """Appends entries, signalling only the inserted rows instead of resetting the model."""
+        if not new_entries: return
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_entries) - 1)
+        self.entries.extend(new_entries)
+        for row, entry in enumerate(new_entries, first):
+            if entry.logo:
+                self.logo_map.setdefault(entry.logo, []).append(row)
+        self.endInsertRows()
+
+    def remove_entries(self, rows):
+        """Removes the given source rows with one row-removal signal per contiguous run."""
+        if not rows: return
+        # Back to front so earlier runs keep their indices
+        for first, last in reversed(list(contiguous_runs(sorted(set(rows))))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for entry in self.entries[first:last + 1]:
+                self.validation_data.pop(id(entry), None)
+                self.highlight_data.pop(id(entry), None)
+                self.security_data.pop(id(entry), None)
+            del self.entries[first:last + 1]
+            self.endRemoveRows()
+        self.rebuild_logo_map()
+
+    def set_highlights(self, rows, color=None):
+        """Highlights the given source rows, replacing any previous highlights.
+
+        Only rows whose background actually changes are repainted.
+        """
+        entries = self.entries
+        previous = self.highlight_data
+        changed = set()
+        if previous:
+            # The rows recorded last time still hold the highlighted entries unless
+            # rows were moved or removed since; only then search the whole list
+            count = len(entries)
+            changed = {r for r in self.highlight_rows if r < count and id(entries[r]) in previous}
+            if len(changed) < len(previous):
+                changed = {r for r, e in enumerate(entries) if id(e) in previous}
+        self.highlight_data = {id(entries[r]): color for r in rows}
+        self.highlight_rows = set(rows)
+        changed.update(self.highlight_rows)
+        self.emit_rows_changed(changed, [Qt.ItemDataRole.BackgroundRole])
+
+    def emit_rows_changed(self, rows, roles=()):
+        """Emits one dataChanged per contiguous run of the given source rows."""
+        last_col = self.columnCount() - 1
+        for first, last in contiguous_runs(sorted(set(rows))):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col), list(roles))
+
+    def swap_rows(self, upper, lower):
+        """Swaps two adjacent rows by moving the lower one up, without resetting the model."""
+        if not self.beginMoveRows(QModelIndex(), lower, lower, QModelIndex(), upper):
+            return
+        entries = self.entries
+        entries[upper], entries[lower] = entries[lower], entries[upper]
+        # Keep the logo row index in step for the two moved entries
+        for row, old_row in ((upper, lower), (lower, upper)):
+            rows = self.logo_map.get(entries[row].logo)
+            if rows and old_row in rows:
+                rows[rows.index(old_row)] = row
+        self.endMoveRows()
+
     def move_rows(self, rows, target_row):
+        """Moves rows in place so they land before target_row, keeping their order."""
         if not rows: return
-        self.beginResetModel()
-        items = [self.entries[r] for r in sorted(rows)]
-        # Remove in reverse to keep indices valid
-        for r in sorted(rows, reverse=True):
-            del self.entries[r]
-            if r < target_row:
-                target_row -= 1
-        # Insert at new position
-        for item in reversed(items):
-            self.entries.insert(target_row, item)
-        self.endResetModel()
+        rows = sorted(set(rows))
+        first, last = rows[0], rows[-1]
+        # A single block (the usual drag) is announced as a move, which keeps
+        # selection and scroll position; scattered rows still reset the view
+        single_run = last - first + 1 == len(rows)
+        if single_run:
+            if first <= target_row <= last + 1:
+                return  # Dropped onto itself
+            if not self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), target_row):
+                return
+        else:
+            self.beginResetModel()
+
+        entries = self.entries
+        moving = set(rows)
+        items = [entries[r] for r in rows]
+        rest = [e for i, e in enumerate(entries) if i not in moving]
+        target_row -= sum(1 for r in rows if r < target_row)
+        # Rebuild the list in one pass instead of a del/insert per row
+        entries[:] = rest[:target_row] + items + rest[target_row:]
+        self.rebuild_logo_map()
+
+        if single_run:
+            self.endMoveRows()
+        else:
+            self.endResetModel()
 
     def flags(self, index):
         if not index.isValid():
@@ -897,11 +1143,29 @@ class PlaylistProxyModel(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.filter_text = ""
+        self.filter_text_lower = ""
         self.filter_group = "All Groups"
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.show_favorites_only = False
         self.filter_health = "All Health"
         self.filter_language = "All Languages"
+        self.language_re = None
+
+    def set_filters(self, text, group, health, language):
+        """Updates the filter criteria and re-filters.
+
+        Anything filterAcceptsRow would otherwise recompute per row (the lowercased
+        search text, the language patterns) is prepared here once.
+        """
+        self.filter_text = text
+        self.filter_text_lower = text.lower()
+        # Interned like the entries' groups, so the per-row comparison is usually by identity
+        self.filter_group = sys.intern(group)
+        self.filter_health = health
+        self.filter_language = language
+        patterns = LANGUAGE_PATTERNS.get(language, []) if language != "All Languages" else []
+        self.language_re = re.compile("|".join(r'\b' + p + r'\b' for p in patterns)) if patterns else None
+        self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row, source_parent):
         model = self.sourceModel()
@@ -913,10 +1177,15 @@ class PlaylistProxyModel(QSortFilterProxyModel):
         if self.show_favorites_only and not entry.favorite:
             return False
 
+        # Group Filter first: a single comparison that rejects most rows when a group
+        # is selected, before any of the costlier checks below run
+        if self.filter_group != "All Groups" and entry.group != self.filter_group:
+            return False
+
         # Health Filter (Status)
         if self.filter_health != "All Health":
             val_data = model.validation_data.get(id(entry))
-            is_valid = val_data[2] if val_data else None
+            is_valid = val_data[1] if val_data else None
             
             # Fallback to stored status string if runtime data missing
             if is_valid is None and entry.health_status:
@@ -930,26 +1199,16 @@ class PlaylistProxyModel(QSortFilterProxyModel):
             
         # Language Filter
         if self.filter_language != "All Languages":
-            patterns = LANGUAGE_PATTERNS.get(self.filter_language, [])
-            name_lower = entry.name.lower()
-            match = False
-            for pattern in patterns:
-                if re.search(r'\b' + pattern + r'\b', name_lower):
-                    match = True
-                    break
-            if not match: return False
+            if self.language_re is None or not self.language_re.search(entry.search_keys()[0]):
+                return False
 
         # Text Filter (Global Search: Name, Group, URL, EPG ID)
-        txt = self.filter_text.lower()
+        txt = self.filter_text_lower
         if not txt:
-            text_match = True
-        else:
-            text_match = (txt in entry.name.lower() or txt in entry.group.lower() or 
-                          txt in entry.url.lower() or txt in entry.tvg_id.lower())
-
-        group_match = (self.filter_group == "All Groups" or entry.group == self.filter_group)
-        
-        return text_match and group_match
+            return True
+        name_lower, group_lower, url_lower, tvg_id_lower = entry.search_keys()
+        return (txt in name_lower or txt in group_lower or 
+                txt in url_lower or txt in tvg_id_lower)
 
     def flags(self, index):
         if not index.isValid():
@@ -1751,9 +2010,14 @@ class FuzzyFinderWorker(QRunnable):
         results = []
         # Compare each item with the next few items
         lookahead = 10 
+        threshold = self.threshold
+        # SequenceMatcher caches its analysis of seq2, so keep the current name there
+        # and only swap the neighbour being compared
+        matcher = difflib.SequenceMatcher(None)
         
         for i in range(len(indexed_names)):
             name1, idx1 = indexed_names[i]
+            matcher.set_seq2(name1)
             for j in range(i + 1, min(i + lookahead, len(indexed_names))):
                 name2, idx2 = indexed_names[j]
                 
@@ -1761,8 +2025,12 @@ class FuzzyFinderWorker(QRunnable):
                 if abs(len(name1) - len(name2)) > 3:
                     continue
                     
-                ratio = difflib.SequenceMatcher(None, name1, name2).ratio()
-                if ratio >= self.threshold:
+                matcher.set_seq1(name2)
+                # Cheap upper bounds first; the full ratio only for plausible pairs
+                if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= threshold:
                     results.append((idx1, idx2, ratio))
                     
         self.signals.result.emit(results)
@@ -2759,9 +3027,8 @@ class StreamPreviewDialog(QDialog):
         self.lbl_name.setText(self.entry.name)
         
         # Block signals to prevent on_group_changed from firing during load
-        self.input_group.blockSignals(True)
-        self.input_group.setText(self.entry.group)
-        self.input_group.blockSignals(False)
+        with QSignalBlocker(self.input_group):
+            self.input_group.setText(self.entry.group)
         
         self.lbl_url.setText(self.entry.url)
         
@@ -2813,7 +3080,6 @@ class StreamPreviewDialog(QDialog):
         if self.parent():
             # Update main window UI
             self.parent().refresh_table()
-            self.parent().update_group_combo()
             self.parent().set_modified(True)
 
     def prev_channel(self):
@@ -2895,44 +3161,42 @@ class StreamPreviewDialog(QDialog):
 
     def update_track_lists(self):
         # Audio
-        self.combo_audio.blockSignals(True)
-        self.combo_audio.clear()
-        try:
-            audio_tracks = self.player.audioTracks()
-            if audio_tracks:
-                for i, track in enumerate(audio_tracks):
-                    lang = track.stringValue(QMediaMetaData.Key.Language) or f"Track {i+1}"
-                    self.combo_audio.addItem(lang, i)
-                self.combo_audio.setCurrentIndex(self.player.activeAudioTrack())
-                self.combo_audio.setEnabled(True)
-            else:
-                self.combo_audio.addItem("Default")
-                self.combo_audio.setEnabled(False)
-        except Exception as e:
-             logging.debug(f"Error updating audio tracks: {e}")
-             self.combo_audio.addItem("Audio N/A")
-             self.combo_audio.setEnabled(False)
-        self.combo_audio.blockSignals(False)
+        with QSignalBlocker(self.combo_audio):
+            self.combo_audio.clear()
+            try:
+                audio_tracks = self.player.audioTracks()
+                if audio_tracks:
+                    for i, track in enumerate(audio_tracks):
+                        lang = track.stringValue(QMediaMetaData.Key.Language) or f"Track {i+1}"
+                        self.combo_audio.addItem(lang, i)
+                    self.combo_audio.setCurrentIndex(self.player.activeAudioTrack())
+                    self.combo_audio.setEnabled(True)
+                else:
+                    self.combo_audio.addItem("Default")
+                    self.combo_audio.setEnabled(False)
+            except Exception as e:
+                 logging.debug(f"Error updating audio tracks: {e}")
+                 self.combo_audio.addItem("Audio N/A")
+                 self.combo_audio.setEnabled(False)
         
         # Subtitles
-        self.combo_subs.blockSignals(True)
-        self.combo_subs.clear()
-        try:
-            sub_tracks = self.player.subtitleTracks()
-            if sub_tracks:
-                for i, track in enumerate(sub_tracks):
-                    lang = track.stringValue(QMediaMetaData.Key.Language) or f"Sub {i+1}"
-                    self.combo_subs.addItem(lang, i)
-                self.combo_subs.setCurrentIndex(self.player.activeSubtitleTrack())
-                self.combo_subs.setEnabled(True)
-            else:
-                self.combo_subs.addItem("No Subs")
-                self.combo_subs.setEnabled(False)
-        except Exception as e:
-             logging.debug(f"Error updating subtitle tracks: {e}")
-             self.combo_subs.addItem("Subs N/A")
-             self.combo_subs.setEnabled(False)
-        self.combo_subs.blockSignals(False)
+        with QSignalBlocker(self.combo_subs):
+            self.combo_subs.clear()
+            try:
+                sub_tracks = self.player.subtitleTracks()
+                if sub_tracks:
+                    for i, track in enumerate(sub_tracks):
+                        lang = track.stringValue(QMediaMetaData.Key.Language) or f"Sub {i+1}"
+                        self.combo_subs.addItem(lang, i)
+                    self.combo_subs.setCurrentIndex(self.player.activeSubtitleTrack())
+                    self.combo_subs.setEnabled(True)
+                else:
+                    self.combo_subs.addItem("No Subs")
+                    self.combo_subs.setEnabled(False)
+            except Exception as e:
+                 logging.debug(f"Error updating subtitle tracks: {e}")
+                 self.combo_subs.addItem("Subs N/A")
+                 self.combo_subs.setEnabled(False)
 
     def set_audio_track(self, index):
         self.player.setActiveAudioTrack(index)
@@ -3066,7 +3330,7 @@ class ManageGroupsDialog(QDialog):
 
     def refresh_group_list(self):
         self.group_list.clear()
-        unique_groups = sorted(list(set(e.group for e in self.entries if e.group)))
+        unique_groups = sorted(set(map(attrgetter('group'), self.entries)) - {""})
         self.group_list.addItems(unique_groups)
 
     def add_group(self):
@@ -3090,6 +3354,7 @@ class ManageGroupsDialog(QDialog):
         
         if ok and new_name and new_name != old_name:
             count = 0
+            new_name = sys.intern(new_name)
             for entry in self.entries:
                 if entry.group == old_name:
                     entry.group = new_name
@@ -3350,10 +3615,10 @@ class StatisticsDialog(QDialog):
         counts = {"Valid": 0, "Invalid": 0, "Untested": 0}
         
         for entry in self.entries:
-            # validation_data: id(entry) -> (color, msg, is_valid)
+            # validation_data: id(entry) -> (msg, is_valid)
             val_info = self.validation_data.get(id(entry))
             if val_info:
-                is_valid = val_info[2]
+                is_valid = val_info[1]
                 if is_valid is True:
                     counts["Valid"] += 1
                 elif is_valid is False:
@@ -3941,9 +4206,8 @@ class CastRemoteDock(QDockWidget):
             self.btn_play.setText("Play")
         
         # Update volume without triggering signal loop if possible
-        self.vol_slider.blockSignals(True)
-        self.vol_slider.setValue(int(status.volume_level * 100))
-        self.vol_slider.blockSignals(False)
+        with QSignalBlocker(self.vol_slider):
+            self.vol_slider.setValue(int(status.volume_level * 100))
 
 class FFmpegSignals(QObject):
     output = pyqtSignal(str)
@@ -4608,10 +4872,17 @@ class LanguageManagerDialog(QDialog):
 class PluginManager:
     def __init__(self, plugin_dir="plugins"):
         self.plugin_dir = os.path.join(get_base_path(), plugin_dir)
+        # Plugins shipped inside a frozen build are listed in a manifest
+        meipass = getattr(sys, '_MEIPASS', None)
+        self.bundled_dir = os.path.join(meipass, plugin_dir) if meipass else None
         self.plugins = [] # List of dicts
 
     def discover_plugins(self):
+        """Lists available plugins. Modules are only imported when first run."""
         self.plugins = []
+        if self.bundled_dir:
+            self.read_manifest(os.path.join(self.bundled_dir, "manifest.json"))
+
         if not os.path.exists(self.plugin_dir):
             try:
                 os.makedirs(self.plugin_dir)
@@ -4619,29 +4890,68 @@ class PluginManager:
                 pass 
             return
             
-        for filename in os.listdir(self.plugin_dir):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                self.load_plugin(os.path.join(self.plugin_dir, filename))
-                
-    def load_plugin(self, filepath):
+        with os.scandir(self.plugin_dir) as it:
+            plugin_files = sorted(e.path for e in it
+                                  if e.name.endswith(".py") and not e.name.startswith("__") and e.is_file())
+        for filepath in plugin_files:
+            self.plugins.append({
+                "name": self.read_plugin_name(filepath),
+                "path": filepath,
+                "module": None,
+                "run": None
+            })
+
+    def read_manifest(self, manifest_path):
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        base_dir = os.path.dirname(manifest_path)
+        for item in manifest:
+            filepath = os.path.join(base_dir, item["file"])
+            # Bundled plugins may ship as bytecode only
+            if not os.path.exists(filepath) and os.path.exists(filepath + "c"):
+                filepath += "c"
+            self.plugins.append({
+                "name": item["name"],
+                "path": filepath,
+                "module": None,
+                "run": None
+            })
+
+    @staticmethod
+    def read_plugin_name(filepath):
+        """Reads PLUGIN_NAME from a plugin's source without executing it."""
+        module_name = os.path.splitext(os.path.basename(filepath))[0]
         try:
-            name = os.path.basename(filepath)
-            module_name = os.path.splitext(name)[0]
+            with open(filepath, 'r', encoding='utf-8') as f:
+                tree = ast.parse(f.read())
+            for node in tree.body:
+                if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                        and any(isinstance(t, ast.Name) and t.id == "PLUGIN_NAME" for t in node.targets)):
+                    return str(node.value.value)
+        except (OSError, SyntaxError, ValueError) as e:
+            logging.error(f"Failed to read plugin {filepath}: {e}")
+        return module_name
+
+    def load_plugin(self, plugin):
+        """Imports the plugin on first use and returns its run() callable."""
+        if plugin["run"] is None:
+            filepath = plugin["path"]
+            module_name = os.path.splitext(os.path.basename(filepath))[0]
             spec = importlib.util.spec_from_file_location(module_name, filepath)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                if hasattr(module, "run") and callable(module.run):
-                    plugin_name = getattr(module, "PLUGIN_NAME", module_name)
-                    self.plugins.append({
-                        "name": plugin_name,
-                        "module": module,
-                        "run": module.run
-                    })
-                    logging.info(f"Loaded plugin: {plugin_name}")
-        except Exception as e:
-            logging.error(f"Failed to load plugin {filepath}: {e}")
+            if not spec or not spec.loader:
+                raise ImportError(f"Cannot load plugin from {filepath}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            if not (hasattr(module, "run") and callable(module.run)):
+                raise AttributeError("Plugin does not define a run(window) function.")
+            plugin["module"] = module
+            plugin["run"] = module.run
+            logging.info(f"Loaded plugin: {plugin['name']}")
+        return plugin["run"]
 
 class NetworkMonitorSignals(QObject):
     update = pyqtSignal(float, float) # upload_speed, download_speed (bytes/sec)
@@ -4791,6 +5101,12 @@ DEFAULT_THEME = {
 APP_VERSION = "1.0.0"
 GITHUB_REPO = "kamalsoft/m3u-editor"
 
+# Common VLC install locations, checked on Windows when vlc is not in PATH
+VLC_WINDOWS_PATHS = [
+    os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "VideoLAN", "VLC", "vlc.exe"),
+    os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "VideoLAN", "VLC", "vlc.exe")
+] if sys.platform == "win32" else []
+
 def get_base_path():
     """Returns the base path of the application, handling frozen (packaged) state."""
     if getattr(sys, 'frozen', False):
@@ -5153,11 +5469,25 @@ class M3UEditorWindow(QMainWindow):
         self.resize(1000, 700)
         
         self.entries: List[M3UEntry] = []
+        self.group_counts = Counter() # group -> number of entries, kept in step with the model
+        self.combo_groups = None      # groups currently listed in group_combo
         self.current_file_path: Optional[str] = None
         self.current_url: Optional[str] = None
         self.thread_pool = QThreadPool()
         # Limit concurrent threads to prevent resource exhaustion/crashes
         self.thread_pool.setMaxThreadCount(5)
+        # Stream checks spend nearly all their time waiting on the network, so they
+        # get their own, wider pool instead of queueing behind the 5 shared threads
+        self.validation_pool = QThreadPool()
+        self.validation_pool.setMaxThreadCount(32)
+        self.validation_cancel = threading.Event()
+        # Validation results arrive one signal per stream; buffer them and apply
+        # them to the model in batches so large runs don't flood the table with repaints
+        self.pending_validation_results = []
+        self.validation_flush_timer = QTimer(self)
+        self.validation_flush_timer.setSingleShot(True)
+        self.validation_flush_timer.setInterval(200)
+        self.validation_flush_timer.timeout.connect(self.flush_validation_results)
         self.validation_pending_count = 0
         self.scrape_pending_count = 0
         self.audit_pending_count = 0
@@ -5171,6 +5501,7 @@ class M3UEditorWindow(QMainWindow):
         self.recent_files = self.settings.value("recent_files", [], type=list)
         self.settings = QSettings("OpenSource", "M3UEditor")
         self.recent_files = self.settings.value("recent_files", [], type=list)
+        self.vlc_cmd = None  # Resolved VLC executable, reset when the path setting changes
         self.epg_urls = self.settings.value("epg_urls", [], type=list)
         # Migration from single url
         self.epg_url = ""
@@ -5323,7 +5654,14 @@ class M3UEditorWindow(QMainWindow):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Global Search (Name, URL, Group, ID)...")
         self.search_bar.setFixedWidth(200)
-        self.search_bar.textChanged.connect(self.filter_table)
+        # Re-filter once typing pauses rather than scanning every row on each keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(250)
+        self.filter_timer.timeout.connect(self.filter_table)
+        self.search_bar.textChanged.connect(lambda: self.filter_timer.start())
+        # Enter applies the search immediately
+        self.search_bar.returnPressed.connect(self.filter_table)
         
         self.group_combo = QComboBox()
         self.group_combo.setFixedWidth(150)
@@ -5401,8 +5739,14 @@ class M3UEditorWindow(QMainWindow):
         # View 1: Table
         self.table = PlaylistTable()
         self.model = PlaylistModel(self.entries)
+        self.update_validation_brushes()
         self.model.request_logo.connect(self.fetch_logo) # Connect logo fetcher
-        self.model.dataChanged.connect(lambda: self.set_modified(True))
+        self.model.dataChanged.connect(self.on_model_data_changed)
+        # Keep the group counts in step with every row insert, removal and reset;
+        # in-place group edits adjust them where the edit happens
+        self.model.rowsInserted.connect(self.on_model_rows_inserted)
+        self.model.rowsAboutToBeRemoved.connect(self.on_model_rows_about_to_be_removed)
+        self.model.modelReset.connect(self.update_group_combo)
         
         self.proxy_model = PlaylistProxyModel()
         self.proxy_model.setSourceModel(self.model)
@@ -5410,6 +5754,8 @@ class M3UEditorWindow(QMainWindow):
         
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        # Size the auto-fit column from the visible rows only, not the first 1000 after every reset
+        self.table.horizontalHeader().setResizeContentsPrecision(0)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setDragEnabled(True)
@@ -5419,7 +5765,6 @@ class M3UEditorWindow(QMainWindow):
         self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        # self.table.orderChanged.connect(self.sync_entries_from_table) # No longer needed, model is source of truth
         self.table.aboutToChangeOrder.connect(self.save_undo_state)
         
         self.view_stack.addWidget(self.table)
@@ -5962,7 +6307,6 @@ class M3UEditorWindow(QMainWindow):
         self.epg_url = ""
         self.set_modified(False)
         self.refresh_table()
-        self.update_group_combo()
         self.clear_editor()
         self.status_label.setText("Ready")
         self.log_action("Closed file")
@@ -6004,6 +6348,9 @@ class M3UEditorWindow(QMainWindow):
     def stop_background_tasks(self):
         """Stops all pending background tasks."""
         self.thread_pool.clear()
+        self.validation_pool.clear()
+        # Checks already in flight can't be interrupted, but they drop their results
+        self.validation_cancel.set()
         self.validation_pending_count = 0
         self.scrape_pending_count = 0
         self.audit_pending_count = 0
@@ -6054,14 +6401,12 @@ class M3UEditorWindow(QMainWindow):
             try:
                 with zipfile.ZipFile(filepath, 'r') as zf:
                     with zf.open("playlist.m3u") as f:
-                        content = f.read().decode('utf-8', errors='ignore')
-                        lines = content.splitlines()
+                        entries = M3UParser.parse_lines(io.TextIOWrapper(f, encoding='utf-8', errors='ignore'))
                         
                 self.save_undo_state()
-                self.entries = M3UParser.parse_lines(lines)
+                self.entries = entries
                 self.model.entries = self.entries
                 self.refresh_table()
-                self.update_group_combo()
                 self.log_action(f"Restored backup: {item}")
                 QMessageBox.information(self, "Success", "Backup restored successfully.")
             except Exception as e:
@@ -6069,7 +6414,15 @@ class M3UEditorWindow(QMainWindow):
 
     def save_undo_state(self):
         """Saves the current state of entries to the undo stack."""
-        self.undo_stack.push(self.entries)
+        # Entries are edited in place, so the snapshot needs its own entry objects.
+        # A shallow copy covers the string and bool fields, which are only ever
+        # reassigned; validation_history is appended to in place and gets its own list.
+        snapshot = []
+        for entry in self.entries:
+            saved = copy.copy(entry)
+            saved.validation_history = entry.validation_history.copy()
+            snapshot.append(saved)
+        self.undo_stack.push(snapshot)
 
     def undo(self):
         prev_state = self.undo_stack.undo(self.entries)
@@ -6077,7 +6430,6 @@ class M3UEditorWindow(QMainWindow):
             self.entries = prev_state
             self.model.entries = self.entries
             self.refresh_table(clear_cache=False)
-            self.update_group_combo()
             self.set_modified(True)
             self.log_action("Undo performed")
         else:
@@ -6089,7 +6441,6 @@ class M3UEditorWindow(QMainWindow):
             self.entries = next_state
             self.model.entries = self.entries
             self.refresh_table(clear_cache=False)
-            self.update_group_combo()
             self.set_modified(True)
             self.log_action("Redo performed")
         else:
@@ -6128,7 +6479,7 @@ class M3UEditorWindow(QMainWindow):
                 if not self.epg_url:
                     try:
                         with open(file_name, 'r', encoding='utf-8', errors='ignore') as f:
-                            head = [f.readline() for _ in range(5)]
+                            head = list(itertools.islice(f, 5))
                             self.epg_url = M3UParser.extract_header_info(head).get('url-tvg', "")
                     except Exception:
                         pass
@@ -6136,7 +6487,7 @@ class M3UEditorWindow(QMainWindow):
                 self.add_recent_file(file_name)
             
             if strategy == "dedupe":
-                existing_urls = set(e.url for e in self.entries)
+                existing_urls = set(map(attrgetter('url'), self.entries))
                 unique_new = []
                 for e in new_entries_list:
                     if e.url not in existing_urls:
@@ -6164,7 +6515,6 @@ class M3UEditorWindow(QMainWindow):
 
             self.current_url = None
             self.refresh_table()
-            self.update_group_combo()
             
         except Exception as e:
             logging.error(f"Failed to load M3U files: {e}", exc_info=True)
@@ -6196,11 +6546,7 @@ class M3UEditorWindow(QMainWindow):
             self.entries = M3UParser.parse_file(path)
             
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                self.epg_url = M3UParser.extract_header_info(f.readlines()[:5]).get('url-tvg', "")
-                head = []
-                for _ in range(5):
-                    try: head.append(next(f))
-                    except StopIteration: break
+                head = list(itertools.islice(f, 5))
                 self.epg_url = M3UParser.extract_header_info(head).get('url-tvg', "")
 
             self.model.entries = self.entries
@@ -6209,7 +6555,6 @@ class M3UEditorWindow(QMainWindow):
             self.set_modified(False)
             self.add_recent_file(path)
             self.refresh_table()
-            self.update_group_combo()
             self.log_action(f"Loaded recent file: {os.path.basename(path)}")
         except Exception as e:
             logging.error(f"Failed to load recent file: {e}", exc_info=True)
@@ -6223,11 +6568,21 @@ class M3UEditorWindow(QMainWindow):
             self.status_label.setText(f"Reloaded: {os.path.basename(self.current_file_path)}")
         elif self.current_url:
             logging.info(f"Reloading URL: {self.current_url}")
-            self.load_m3u_from_url(self.current_url)
-            self.status_label.setText("Reloaded from URL")
+            # The download runs in the background; the status is set once it lands
+            self.load_m3u_from_url(self.current_url, reload=True)
         else:
             QMessageBox.information(self, "Reload", "No source is currently open to reload.")
 
+    # Roles that only change how rows look (highlights, logos, tooltips), not the playlist
+    PRESENTATION_ROLES = frozenset((Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.DecorationRole,
+                                    Qt.ItemDataRole.ToolTipRole))
+
+    def on_model_data_changed(self, top_left, bottom_right, roles=()):
+        """Marks the playlist modified, unless only presentation roles were repainted."""
+        if roles and all(role in self.PRESENTATION_ROLES for role in roles):
+            return
+        self.set_modified(True)
+
     def set_modified(self, modified: bool):
         """Sets the modified state and updates the UI accordingly."""
         self.is_modified = modified
@@ -6285,35 +6640,50 @@ class M3UEditorWindow(QMainWindow):
             if dlg.groups_modified:
                 self.set_modified(True)
                 self.refresh_table(clear_cache=False)
-                self.update_group_combo()
                 self.log_action("Groups managed/updated")
 
-    def load_m3u_from_url(self, url=None):
+    def load_m3u_from_url(self, url=None, reload=False):
         if not url:
             url, ok = QInputDialog.getText(self, "Load M3U from URL", "Enter Playlist URL:")
             if not ok or not url:
                 return
                 
         logging.info(f"Loading M3U from URL: {url}")
-        try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                content = response.read().decode('utf-8', errors='ignore')
-                lines = content.splitlines()
-            
-            self.undo_stack.clear()
-            self.entries = M3UParser.parse_lines(lines)
-            self.epg_url = M3UParser.extract_header_info(lines[:5]).get('url-tvg', "")
-            self.model.entries = self.entries
-            self.current_file_path = None # No local file path
-            self.current_url = url
-            self.set_modified(False)
-            self.refresh_table()
-            self.update_group_combo()
+        self.status_label.setText("Downloading playlist...")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+
+        worker = PlaylistLoaderWorker(url)
+        worker.signals.finished.connect(lambda url, entries, epg_url: self.on_url_playlist_loaded(url, entries, epg_url, reload))
+        worker.signals.error.connect(lambda err: QMessageBox.critical(self, "Error", f"Could not load URL: {err}"))
+        worker.signals.error.connect(lambda: self.progress_bar.setVisible(False))
+        self.thread_pool.start(worker)
+
+    def on_url_playlist_loaded(self, url, entries, epg_url, reload=False):
+        self.progress_bar.setVisible(False)
+        # The playlist stays editable while downloading; don't drop unsaved edits silently
+        if self.is_modified:
+            reply = QMessageBox.question(
+                self, "Playlist Downloaded",
+                "The current playlist has unsaved changes.\n\nReplace it with the downloaded playlist?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                self.status_label.setText("Download discarded, kept the current playlist")
+                return
+        self.undo_stack.clear()
+        self.entries = entries
+        self.epg_url = epg_url
+        self.model.entries = self.entries
+        self.current_file_path = None # No local file path
+        self.current_url = url
+        self.set_modified(False)
+        self.refresh_table()
+        if reload:
+            self.status_label.setText("Reloaded from URL")
+        else:
             self.status_label.setText(f"Loaded {len(self.entries)} channels from URL")
-            self.log_action("Loaded playlist from URL")
-        except Exception as e:
-            logging.error(f"Failed to load URL: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Could not load URL: {str(e)}")
+        self.log_action("Loaded playlist from URL")
 
     def load_xtream_codes(self):
         dlg = XtreamLoginDialog(self)
@@ -6333,7 +6703,7 @@ class M3UEditorWindow(QMainWindow):
             # Override EPG
             self.epg_urls = [epg_url]
             self.settings.setValue("epg_urls", self.epg_urls)
-            QMessageBox.information(self, "Xtream Codes", "Playlist loaded and EPG configured.")
+            QMessageBox.information(self, "Xtream Codes", "EPG configured. The playlist is loading in the background.")
 
     def open_cloud_sync(self):
         dlg = CloudSyncDialog(self.settings, self)
@@ -6402,9 +6772,7 @@ class M3UEditorWindow(QMainWindow):
                 if not new_entries:
                     return
                 self.save_undo_state()
-                self.entries.extend(new_entries)
-                self.refresh_table()
-                self.update_group_combo()
+                self.model.append_entries(new_entries)
                 self.set_modified(True)
                 self.status_label.setText(f"Merged {len(new_entries)} channels from {os.path.basename(file_name)}")
                 QMessageBox.information(self, "Success", f"Merged {len(new_entries)} channels.")
@@ -6522,24 +6890,47 @@ class M3UEditorWindow(QMainWindow):
         logging.debug("Table refresh complete.")
         # self.animate_table_refresh() # Animation can be glitchy with proxy resets
 
+    @contextmanager
+    def frozen_table(self):
+        """Suspends table painting while the model is changed in bulk.
+
+        The view repaints once when the block exits, even if it raises.
+        """
+        table = self.table
+        table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def visible_source_rows(self):
+        """Source rows of everything the proxy currently shows, in view order."""
+        proxy = self.proxy_model
+        map_to_source, proxy_index = proxy.mapToSource, proxy.index
+        return [map_to_source(proxy_index(i, 0)).row() for i in range(proxy.rowCount())]
+
+    def selected_proxy_rows(self):
+        """Proxy rows of the selection, read range by range instead of index by index."""
+        rows = []
+        for sel_range in self.table.selectionModel().selection():
+            rows.extend(range(sel_range.top(), sel_range.bottom() + 1))
+        # In Grid View a range covers a single cell, so a row can show up more than once
+        return list(dict.fromkeys(rows))
+
+    def selected_source_rows(self):
+        """Source rows of the selection."""
+        proxy = self.proxy_model
+        map_to_source, proxy_index = proxy.mapToSource, proxy.index
+        return [map_to_source(proxy_index(r, 0)).row() for r in self.selected_proxy_rows()]
+
+    def target_source_rows(self):
+        """Source rows of the selection, or of every visible row when nothing is selected."""
+        return self.selected_source_rows() or self.visible_source_rows()
+
     def get_selected_rows(self):
         """Helper to get selected rows, handling both Table and Grid views."""
-        selection_model = self.table.selectionModel()
-        rows = selection_model.selectedRows()
-        if rows:
-            return rows
-        # Fallback for Grid View (IconMode) where selectedRows() returns empty
-        indexes = selection_model.selectedIndexes()
-        if indexes:
-            # Filter for unique rows
-            seen_rows = set()
-            unique_rows = []
-            for idx in indexes:
-                if idx.row() not in seen_rows:
-                    seen_rows.add(idx.row())
-                    unique_rows.append(idx)
-            return unique_rows
-        return []
+        proxy_index = self.proxy_model.index
+        return [proxy_index(r, 0) for r in self.selected_proxy_rows()]
 
     def on_selection_changed(self):
         """Populates the editor panel when a row is selected."""
@@ -6555,57 +6946,33 @@ class M3UEditorWindow(QMainWindow):
             self.editing_started = False
             
             # Block signals to prevent 'textChanged' from triggering updates while we populate
-            self.input_name.blockSignals(True)
-            self.input_group.blockSignals(True)
-            self.input_logo.blockSignals(True)
-            self.input_tvg_id.blockSignals(True)
-            self.input_chno.blockSignals(True)
-            self.input_url.blockSignals(True)
-            self.input_user_agent.blockSignals(True)
-            
-            self.input_name.setText(entry.name)
-            self.input_group.setText(entry.group)
-            self.input_logo.setText(entry.logo)
-            self.input_url.setText(entry.url)
-            self.input_tvg_id.setText(entry.tvg_id)
-            self.input_chno.setText(entry.tvg_chno)
-            self.input_user_agent.setText(entry.user_agent)
-            
-            self.input_name.blockSignals(False)
-            self.input_group.blockSignals(False)
-            self.input_logo.blockSignals(False)
-            self.input_url.blockSignals(False)
-            self.input_user_agent.blockSignals(False)
-            self.input_tvg_id.blockSignals(False)
-            self.input_chno.blockSignals(False)
+            with signals_blocked(*self.editor_inputs()):
+                self.input_name.setText(entry.name)
+                self.input_group.setText(entry.group)
+                self.input_logo.setText(entry.logo)
+                self.input_url.setText(entry.url)
+                self.input_tvg_id.setText(entry.tvg_id)
+                self.input_chno.setText(entry.tvg_chno)
+                self.input_user_agent.setText(entry.user_agent)
         else:
             self.clear_editor()
 
+    def editor_inputs(self):
+        return (self.input_name, self.input_group, self.input_logo, self.input_tvg_id,
+                self.input_chno, self.input_url, self.input_user_agent)
+
     def clear_editor(self):
-        self.input_name.blockSignals(True)
-        self.input_group.blockSignals(True)
-        self.input_tvg_id.blockSignals(True)
-        self.input_chno.blockSignals(True)
-        self.input_logo.blockSignals(True)
-        self.input_url.blockSignals(True)
-        self.input_user_agent.blockSignals(True)
-
-        self.input_name.clear()
-        self.input_group.clear()
-        self.input_tvg_id.clear()
-        self.input_chno.clear()
-        self.input_logo.clear()
-        self.input_url.clear()
-        self.input_user_agent.clear()
+        with signals_blocked(*self.editor_inputs()):
+            for widget in self.editor_inputs():
+                widget.clear()
 
     def audit_streams(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         rows_to_check = []
         
         if selected_rows:
-            for index in selected_rows:
-                source_index = self.proxy_model.mapToSource(index)
-                rows_to_check.append((source_index.row(), self.entries[source_index.row()].url))
+            for row in selected_rows:
+                rows_to_check.append((row, self.entries[row].url))
         else:
             for row, entry in enumerate(self.entries):
                 rows_to_check.append((row, entry.url))
@@ -6708,16 +7075,19 @@ class M3UEditorWindow(QMainWindow):
             self.editing_started = True
         
         old_logo = entry.logo
+        old_group = entry.group
         entry.name = self.input_name.text()
-        entry.group = self.input_group.text()
+        entry.group = sys.intern(self.input_group.text())
         entry.tvg_id = self.input_tvg_id.text()
         entry.tvg_chno = self.input_chno.text()
         entry.logo = self.input_logo.text()
         entry.url = self.input_url.text()
-        entry.user_agent = self.input_user_agent.text()
+        entry.user_agent = sys.intern(self.input_user_agent.text())
         
         if entry.logo != old_logo:
             self.model.rebuild_logo_map()
+        if entry.group != old_group:
+            self.adjust_group_counts(removed=[old_group], added=[entry.group])
             
         # Update table display immediately
         self.model.dataChanged.emit(self.model.index(row, 0), self.model.index(row, 2))
@@ -6726,8 +7096,7 @@ class M3UEditorWindow(QMainWindow):
     def add_entry(self):
         self.save_undo_state()
         new_entry = M3UEntry(name="New Channel", url="http://", group="Uncategorized")
-        self.entries.append(new_entry)
-        self.refresh_table(clear_cache=False)
+        self.model.append_entries([new_entry])
         self.set_modified(True)
         self.log_action(f"Added new entry: {new_entry.name}")
         # Find the new item in the proxy model to select it
@@ -6748,35 +7117,23 @@ class M3UEditorWindow(QMainWindow):
         if confirm == QMessageBox.StandardButton.Yes:
             self.create_backup("before_delete")
             self.save_undo_state()
-            # Remove rows in reverse order to maintain correct indices during deletion
-            self.model.beginResetModel()
             # Convert all proxy indices to source indices
-            source_indices = [self.proxy_model.mapToSource(idx) for idx in selected_rows]
-            
-            for index in sorted(source_indices, key=lambda x: x.row(), reverse=True):
-                del self.entries[index.row()]
-            self.model.rebuild_logo_map()
-            self.model.endResetModel()
+            source_rows = [self.proxy_model.mapToSource(idx).row() for idx in selected_rows]
+            self.model.remove_entries(source_rows)
             self.clear_editor()
             self.set_modified(True)
             self.log_action(f"Deleted {count} entries")
 
     def move_up(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         if not selected_rows:
             return
         
-        # Map to source
-        proxy_index = selected_rows[0]
-        source_index = self.proxy_model.mapToSource(proxy_index)
-        row = source_index.row()
+        row = selected_rows[0]
         
         if row > 0:
             self.save_undo_state()
-            # Swap in list
-            self.entries[row], self.entries[row-1] = self.entries[row-1], self.entries[row]
-            # Refresh and keep selection
-            self.refresh_table(clear_cache=False)
+            self.model.swap_rows(row - 1, row)
             self.set_modified(True)
             # Re-select based on new source position
             new_source_index = self.model.index(row - 1, 0)
@@ -6785,19 +7142,15 @@ class M3UEditorWindow(QMainWindow):
                 self.table.selectRow(new_proxy_index.row())
 
     def move_down(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         if not selected_rows:
             return
         
-        proxy_index = selected_rows[0]
-        source_index = self.proxy_model.mapToSource(proxy_index)
-        row = source_index.row()
+        row = selected_rows[0]
         
         if row < len(self.entries) - 1:
             self.save_undo_state()
-            # Swap in list
-            self.entries[row], self.entries[row+1] = self.entries[row+1], self.entries[row]
-            self.refresh_table(clear_cache=False)
+            self.model.swap_rows(row, row + 1)
             self.set_modified(True)
             new_source_index = self.model.index(row + 1, 0)
             new_proxy_index = self.proxy_model.mapFromSource(new_source_index)
@@ -6805,27 +7158,56 @@ class M3UEditorWindow(QMainWindow):
                 self.table.selectRow(new_proxy_index.row())
 
     def update_group_combo(self):
+        """Recounts groups across all entries and refreshes the combo if the set changed."""
+        # Scan the one column through a C-level getter rather than a generator
+        self.group_counts = Counter(map(attrgetter('group'), self.entries))
+        self.sync_group_combo()
+
+    def on_model_rows_inserted(self, parent, first, last):
+        self.adjust_group_counts(added=[e.group for e in self.entries[first:last + 1]])
+
+    def on_model_rows_about_to_be_removed(self, parent, first, last):
+        self.adjust_group_counts(removed=[e.group for e in self.entries[first:last + 1]])
+
+    def adjust_group_counts(self, removed=(), added=()):
+        """Updates group counts for a few edited entries without rescanning the playlist."""
+        counts = self.group_counts
+        changed = False
+        for group in removed:
+            counts[group] -= 1
+            if counts[group] <= 0:
+                del counts[group]
+                changed = True
+        for group in added:
+            counts[group] += 1
+            if counts[group] == 1:
+                changed = True
+        if changed:
+            self.sync_group_combo()
+
+    def sync_group_combo(self):
+        groups = sorted(g for g in self.group_counts if g)
+        if groups == self.combo_groups:
+            return
+        self.combo_groups = groups
+
         current = self.group_combo.currentText()
-        self.group_combo.blockSignals(True)
-        self.group_combo.clear()
-        self.group_combo.addItem("All Groups")
-        
-        groups = sorted(list(set(entry.group for entry in self.entries if entry.group)))
-        self.group_combo.addItems(groups)
-        
-        if current in groups:
-            self.group_combo.setCurrentText(current)
-        self.group_combo.blockSignals(False)
+        with QSignalBlocker(self.group_combo):
+            self.group_combo.clear()
+            self.group_combo.addItem("All Groups")
+            self.group_combo.addItems(groups)
+            
+            if current in groups:
+                self.group_combo.setCurrentText(current)
 
     def on_group_combo_changed(self, text):
         self.filter_table()
 
     def filter_table(self):
-        self.proxy_model.filter_text = self.search_bar.text()
-        self.proxy_model.filter_group = self.group_combo.currentText()
-        self.proxy_model.filter_health = self.health_combo.currentText()
-        self.proxy_model.filter_language = self.language_combo.currentText()
-        self.proxy_model.invalidateFilter()
+        # Applies any pending search text too, so a queued debounce has nothing left to do
+        self.filter_timer.stop()
+        self.proxy_model.set_filters(self.search_bar.text(), self.group_combo.currentText(),
+                                     self.health_combo.currentText(), self.language_combo.currentText())
 
     def reset_filters(self):
         self.search_bar.clear()
@@ -6835,8 +7217,9 @@ class M3UEditorWindow(QMainWindow):
         # filter_table is called automatically via signals
 
     def bulk_edit_group(self):
-        selected_indices = self.get_selected_rows()
-        if not selected_indices:
+        # Capture source rows before modification
+        rows = [row for row in self.selected_source_rows() if 0 <= row < len(self.entries)]
+        if not rows:
             QMessageBox.warning(self, "Warning", "No channels selected.")
             return
             
@@ -6845,15 +7228,18 @@ class M3UEditorWindow(QMainWindow):
             self.create_backup("bulk_group")
             self.save_undo_state()
             
-            # Capture source rows before modification
-            rows = [self.proxy_model.mapToSource(idx).row() for idx in selected_indices]
-            
-            for row in rows:
-                if 0 <= row < len(self.entries):
-                    self.entries[row].group = new_group
-            
-            self.refresh_table(clear_cache=False)
-            self.update_group_combo()
+            # Share one string object across the edited entries, as the parser does
+            new_group = sys.intern(new_group)
+            old_groups = []
+            with self.frozen_table():
+                for row in rows:
+                    entry = self.entries[row]
+                    old_groups.append(entry.group)
+                    entry.group = new_group
+                
+                # One change notification per run of edited rows instead of a model reset
+                self.model.emit_rows_changed(rows, [Qt.ItemDataRole.DisplayRole])
+            self.adjust_group_counts(removed=old_groups, added=[new_group] * len(rows))
             self.set_modified(True)
             self.log_action(f"Bulk edited group for {len(rows)} items")
 
@@ -6883,8 +7269,8 @@ class M3UEditorWindow(QMainWindow):
             self.input_logo.setText(url)
 
     def bulk_edit_attributes(self):
-        selected_indices = self.get_selected_rows()
-        if not selected_indices:
+        rows = self.selected_source_rows()
+        if not rows:
             QMessageBox.warning(self, "Warning", "No channels selected.")
             return
             
@@ -6897,7 +7283,6 @@ class M3UEditorWindow(QMainWindow):
             self.create_backup("bulk_edit")
             self.save_undo_state()
             
-            rows = [self.proxy_model.mapToSource(idx).row() for idx in selected_indices]
             count = 0
             
             for row in rows:
@@ -6909,13 +7294,13 @@ class M3UEditorWindow(QMainWindow):
                     count += 1
             
             self.refresh_table(clear_cache=False)
-            self.update_group_combo()
             self.set_modified(True)
             self.log_action(f"Bulk edited attributes for {count} items")
 
     def batch_edit_user_agent(self):
-        selected_indices = self.get_selected_rows()
-        if not selected_indices:
+        # Capture source rows before modification
+        rows = self.selected_source_rows()
+        if not rows:
             QMessageBox.warning(self, "Warning", "No channels selected.")
             return
             
@@ -6924,9 +7309,7 @@ class M3UEditorWindow(QMainWindow):
             self.create_backup("batch_ua")
             self.save_undo_state()
             
-            # Capture source rows before modification
-            rows = [self.proxy_model.mapToSource(idx).row() for idx in selected_indices]
-            
+            new_ua = sys.intern(new_ua)
             for row in rows:
                 if 0 <= row < len(self.entries):
                     self.entries[row].user_agent = new_ua
@@ -7040,35 +7423,15 @@ class M3UEditorWindow(QMainWindow):
             QMessageBox.information(self, "Success", "Channel numbering applied.")
             self.log_action("Applied channel numbering")
 
-    def sync_entries_from_table(self):
-        """No longer needed with QAbstractTableModel as self.entries is the source of truth."""
-        pass
-
     def validate_streams(self):
         # If already validating, maybe stop? 
         # QThreadPool doesn't support easy "stop all", so we just let them finish 
         # or we could implement a flag in workers. For now, we just start new ones.
         # To keep it simple, we won't implement a hard stop button for the pool.
 
-        # Determine rows to validate
-        selected_rows = self.table.selectionModel().selectedRows()
-        rows_to_check = []
-        
-        if selected_rows:
-            for index in selected_rows:
-                source_index = self.proxy_model.mapToSource(index)
-                row = source_index.row()
-                entry = self.entries[row]
-                rows_to_check.append((row, entry.url, entry.user_agent))
-        else:
-            # Check ALL rows (source), not just visible ones, or visible ones?
-            # "Check All" usually implies all.
-            # If filter is active, maybe just visible? Let's do visible rows to respect filter.
-            for row in range(self.proxy_model.rowCount()):
-                proxy_index = self.proxy_model.index(row, 0)
-                source_index = self.proxy_model.mapToSource(proxy_index)
-                entry = self.entries[source_index.row()]
-                rows_to_check.append((source_index.row(), entry.url, entry.user_agent))
+        # Determine rows to validate: the selection, or every visible row to respect the filter
+        entries = self.entries
+        rows_to_check = [(row, entries[row].url, entries[row].user_agent) for row in self.target_source_rows()]
 
         if not rows_to_check:
             return
@@ -7082,12 +7445,14 @@ class M3UEditorWindow(QMainWindow):
         self.status_label.setText(f"Validating {len(rows_to_check)} streams...")
         
         self.validation_pending_count = len(rows_to_check)
+        # Fresh token per run, so stragglers from a stopped run can't count towards this one
+        self.validation_cancel = threading.Event()
 
         for row, url, ua in rows_to_check:
-            worker = ValidationWorker(row, url, ua)
+            worker = ValidationWorker(row, url, ua, self.validation_cancel)
             worker.signals.result.connect(self.on_validation_result)
             worker.signals.finished.connect(self.on_validation_finished_one)
-            self.thread_pool.start(worker)
+            self.validation_pool.start(worker)
 
     def on_validation_finished_one(self):
         self.validation_pending_count -= 1
@@ -7101,24 +7466,47 @@ class M3UEditorWindow(QMainWindow):
             self.on_validation_complete()
 
     def on_validation_result(self, row_index, is_valid, message):
-        if self.is_dark_mode:
-            color = QColor("#1b5e20") if is_valid else QColor("#b71c1c") # Darker Green/Red
-        else:
-            color = QColor("#c8e6c9") if is_valid else QColor("#ffcdd2") # Light Green/Red
-            
-        if row_index < len(self.entries):
-            entry = self.entries[row_index]
-            
-            # Update History
-            entry.validation_history.append((time.time(), is_valid))
-            
-            self.model.validation_data[id(entry)] = (color, message, is_valid)
-            entry.health_status = message
+        self.pending_validation_results.append((row_index, is_valid, message))
+        if not self.validation_flush_timer.isActive():
+            self.validation_flush_timer.start()
+
+    def flush_validation_results(self):
+        """Applies buffered validation results with a single model update."""
+        self.validation_flush_timer.stop()
+        results, self.pending_validation_results = self.pending_validation_results, []
+        if not results:
+            return
+
+        now = time.time()
+        # Bind what the loop touches once per result
+        entries = self.entries
+        count = len(entries)
+        validation_data = self.model.validation_data
+        applied = []
+        for row_index, is_valid, message in results:
+            if row_index < count:
+                entry = entries[row_index]
+                
+                # Update History
+                entry.validation_history.append((now, is_valid))
+                
+                validation_data[id(entry)] = (message, is_valid)
+                entry.health_status = message
+                applied.append(row_index)
+
+        if applied:
             if not self.is_modified:
                 self.set_modified(True)
-            self.model.dataChanged.emit(self.model.index(row_index, 0), self.model.index(row_index, 2))
+            # One signal per run of validated rows; a single min..max span would make the
+            # proxy re-filter and re-sort every row in between. Only the colour, tooltip
+            # and validity change, unless the health filter needs to see the new status
+            roles = ()
+            if self.proxy_model.filter_health == "All Health":
+                roles = [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.UserRole + 1]
+            self.model.emit_rows_changed(applied, roles)
 
     def on_validation_complete(self):
+        self.flush_validation_results()
         self.btn_validate.setText("Check Stream Health")
         self.btn_validate.setEnabled(True)
         self.progress_bar.setVisible(False)
@@ -7127,22 +7515,8 @@ class M3UEditorWindow(QMainWindow):
         self.log_action("Stream validation completed")
 
     def check_resolutions(self):
-        selected_rows = self.table.selectionModel().selectedRows()
-        rows_to_check = []
-        
-        if selected_rows:
-            for index in selected_rows:
-                source_index = self.proxy_model.mapToSource(index)
-                row = source_index.row()
-                entry = self.entries[row]
-                rows_to_check.append((row, entry.url))
-        else:
-            # Check visible rows
-            for row in range(self.proxy_model.rowCount()):
-                proxy_index = self.proxy_model.index(row, 0)
-                source_index = self.proxy_model.mapToSource(proxy_index)
-                entry = self.entries[source_index.row()]
-                rows_to_check.append((source_index.row(), entry.url))
+        # The selection, or every visible row when nothing is selected
+        rows_to_check = [(row, self.entries[row].url) for row in self.target_source_rows()]
                 
         if not rows_to_check: return
         self.btn_stop.setEnabled(True)
@@ -7164,22 +7538,8 @@ class M3UEditorWindow(QMainWindow):
             self.model.dataChanged.emit(self.model.index(row, 1), self.model.index(row, 1))
 
     def check_latency(self):
-        selected_rows = self.table.selectionModel().selectedRows()
-        rows_to_check = []
-        
-        if selected_rows:
-            for index in selected_rows:
-                source_index = self.proxy_model.mapToSource(index)
-                row = source_index.row()
-                entry = self.entries[row]
-                rows_to_check.append((row, entry.url))
-        else:
-            # Check visible rows
-            for row in range(self.proxy_model.rowCount()):
-                proxy_index = self.proxy_model.index(row, 0)
-                source_index = self.proxy_model.mapToSource(proxy_index)
-                entry = self.entries[source_index.row()]
-                rows_to_check.append((source_index.row(), entry.url))
+        # The selection, or every visible row when nothing is selected
+        rows_to_check = [(row, self.entries[row].url) for row in self.target_source_rows()]
                 
         if not rows_to_check: return
         self.btn_stop.setEnabled(True)
@@ -7205,7 +7565,7 @@ class M3UEditorWindow(QMainWindow):
         broken_rows = []
         for row, entry in enumerate(self.entries):
             # Check validation data
-            is_valid = self.model.validation_data.get(id(entry), (None, None, None))[2]
+            is_valid = self.model.validation_data.get(id(entry), (None, None))[1]
             if is_valid is False:
                 broken_rows.append(row)
         
@@ -7240,7 +7600,7 @@ class M3UEditorWindow(QMainWindow):
             entry.url = result_data
             self.repaired_count += 1
             # Update model
-            self.model.validation_data[id(entry)] = (QColor("#c8e6c9"), "Repaired", True)
+            self.model.validation_data[id(entry)] = ("Repaired", True)
             self.model.dataChanged.emit(self.model.index(row_index, 0), self.model.index(row_index, 2))
 
     def update_epg_data(self):
@@ -7417,7 +7777,6 @@ class M3UEditorWindow(QMainWindow):
                         count += 1
                         
             self.refresh_table()
-            self.update_group_combo()
             self.set_modified(True)
             QMessageBox.information(self, "Success", f"Categorized {count} channels.")
             self.log_action(f"Smart Grouping (V2) categorized {count} channels")
@@ -7485,7 +7844,6 @@ class M3UEditorWindow(QMainWindow):
                         count += 1
                         
             self.refresh_table()
-            self.update_group_combo()
             QMessageBox.information(self, "Success", f"Added flags to {count} channels.")
             self.log_action(f"Added country flags to {count} channels")
         except Exception as e:
@@ -7493,13 +7851,11 @@ class M3UEditorWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Operation failed: {str(e)}")
 
     def scrape_logos(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         rows_to_check = []
         
         if selected_rows:
-            for index in selected_rows:
-                source_index = self.proxy_model.mapToSource(index)
-                row = source_index.row()
+            for row in selected_rows:
                 entry = self.entries[row]
                 if not entry.logo:
                     rows_to_check.append((row, entry.name))
@@ -7657,7 +8013,7 @@ class M3UEditorWindow(QMainWindow):
         seen_urls = set()
         duplicate_indices = []
         
-        self.model.highlight_data.clear()
+        self.model.set_highlights([])
 
         for i, entry in enumerate(self.entries):
             if entry.url in seen_urls:
@@ -7694,39 +8050,37 @@ class M3UEditorWindow(QMainWindow):
             QMessageBox.information(self, "Success", f"Removed {len(duplicate_indices)} duplicates.")
             
         elif reply == QMessageBox.StandardButton.No:
-            self.table.clearSelection()
-            selection = QItemSelection()
+            # Repaints just the affected rows rather than relayouting the whole view
+            self.model.set_highlights(duplicate_indices, QColor("#fff9c4"))
+            
+            # Mapping to proxy is expensive if filter is active, but necessary for selection
+            proxy_rows = []
             for row in duplicate_indices:
-                entry = self.entries[row]
-                self.model.highlight_data[id(entry)] = QColor("#fff9c4")
-                
-                # Mapping to proxy is expensive if filter is active, but necessary for selection
-                source_index = self.model.index(row, 0)
-                proxy_index = self.proxy_model.mapFromSource(source_index)
+                proxy_index = self.proxy_model.mapFromSource(self.model.index(row, 0))
                 if proxy_index.isValid():
-                    selection.select(proxy_index, proxy_index)
-            
-            self.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
-            self.model.layoutChanged.emit() # Refresh highlights
+                    proxy_rows.append(proxy_index.row())
+            # One selection range per run of adjacent rows, applied in a single call
+            selection = QItemSelection()
+            for first, last in contiguous_runs(sorted(proxy_rows)):
+                selection.select(self.proxy_model.index(first, 0), self.proxy_model.index(last, 0))
+            self.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows)
 
     def find_name_duplicates(self):
-        name_map = {}
+        name_map = defaultdict(list)
         duplicate_indices = []
         
-        self.model.highlight_data.clear()
+        self.model.set_highlights([])
 
         # Group by name (case-insensitive)
         for i, entry in enumerate(self.entries):
-            name = entry.name.strip().lower()
-            if name not in name_map:
-                name_map[name] = []
-            name_map[name].append(i)
+            name_map[entry.name.strip().lower()].append(i)
 
         # Filter for names with multiple entries having different URLs
-        for name, indices in name_map.items():
+        entries = self.entries
+        for indices in name_map.values():
             if len(indices) > 1:
-                urls = set(self.entries[i].url for i in indices)
-                if len(urls) > 1:
+                first_url = entries[indices[0]].url
+                if any(entries[i].url != first_url for i in indices):
                     duplicate_indices.extend(indices)
 
         if not duplicate_indices:
@@ -7744,18 +8098,15 @@ class M3UEditorWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.table.clearSelection()
+            self.model.set_highlights(duplicate_indices, QColor("#e1bee7")) # Light Purple
             selection = QItemSelection()
             for row in duplicate_indices:
-                entry = self.entries[row]
-                self.model.highlight_data[id(entry)] = QColor("#e1bee7") # Light Purple
-                
                 source_index = self.model.index(row, 0)
                 proxy_index = self.proxy_model.mapFromSource(source_index)
                 if proxy_index.isValid():
                     selection.select(proxy_index, proxy_index)
             
             self.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
-            self.model.layoutChanged.emit() # Refresh highlights
 
     def find_fuzzy_duplicates(self):
         if not self.entries:
@@ -7778,15 +8129,15 @@ class M3UEditorWindow(QMainWindow):
             return
             
         dlg = FuzzyResultsDialog(self)
+        highlighted = set()
         for idx1, idx2, ratio in results:
             name1 = self.entries[idx1].name
             name2 = self.entries[idx2].name
             dlg.add_result(name1, name2, ratio)
-            # Highlight in model
-            self.model.highlight_data[id(self.entries[idx1])] = QColor("#ffe0b2") # Light Orange
-            self.model.highlight_data[id(self.entries[idx2])] = QColor("#ffe0b2")
+            highlighted.update((idx1, idx2))
         
-        self.model.layoutChanged.emit()
+        # Highlight in model
+        self.model.set_highlights(highlighted, QColor("#ffe0b2")) # Light Orange
         dlg.exec()
 
     def smart_dedupe(self):
@@ -7861,18 +8212,15 @@ class M3UEditorWindow(QMainWindow):
         
         self.set_modified(True)
         self.refresh_table()
-        self.update_group_combo()
         
         msg = f"Smart Dedupe complete.\nRemoved {removed_count} duplicates.\nKept {kept_count} unique entries."
         QMessageBox.information(self, "Success", msg)
         self.log_action(f"Smart Dedupe removed {removed_count} entries")
 
     def play_stream(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         if selected_rows:
-            proxy_index = selected_rows[0]
-            source_index = self.proxy_model.mapToSource(proxy_index)
-            entry = self.entries[source_index.row()]
+            entry = self.entries[selected_rows[0]]
             self.add_recent_stream(entry)
             self.player.setSource(QUrl(entry.url))
             self.player.play()
@@ -7885,7 +8233,7 @@ class M3UEditorWindow(QMainWindow):
         # Iterate over source entries directly
         for row, entry in enumerate(self.entries):
             # Check validation data
-            is_valid = self.model.validation_data.get(id(entry), (None, None, None))[2]
+            is_valid = self.model.validation_data.get(id(entry), (None, None))[1]
             if is_valid is False: # Explicitly False (failed validation)
                 rows_to_remove.append(row)
         
@@ -7897,11 +8245,10 @@ class M3UEditorWindow(QMainWindow):
         if confirm == QMessageBox.StandardButton.Yes:
             self.create_backup("remove_invalid")
             self.save_undo_state()
-            self.model.beginResetModel()
-            # Remove in reverse order to maintain indices
-            for row in sorted(rows_to_remove, reverse=True):
-                del self.entries[row]
-            self.model.endResetModel()
+            # Failed streams tend to come in runs; paint once after all of them are gone
+            with self.frozen_table():
+                self.model.remove_entries(rows_to_remove)
+            self.set_modified(True)
             QMessageBox.information(self, "Success", "Invalid streams removed.")
 
     def generate_broken_report(self):
@@ -7910,8 +8257,8 @@ class M3UEditorWindow(QMainWindow):
         for row, entry in enumerate(self.entries):
             val_data = self.model.validation_data.get(id(entry))
             # Check validation data or health_status string
-            is_valid = val_data[2] if val_data else None
-            msg = val_data[1] if val_data else entry.health_status
+            is_valid = val_data[1] if val_data else None
+            msg = val_data[0] if val_data else entry.health_status
             
             if is_valid is False or (is_valid is None and entry.health_status and "error" in entry.health_status.lower()):
                 broken_entries.append((entry, msg))
@@ -7945,6 +8292,13 @@ class M3UEditorWindow(QMainWindow):
         else:
             app.setStyleSheet("") # Revert to default Fusion/System style
             app.setStyle("Fusion")
+        if not initial:
+            self.update_validation_brushes()
+
+    def update_validation_brushes(self):
+        """Picks the validation row backgrounds for the current theme, once per theme change."""
+        model = self.model
+        model.valid_brush, model.invalid_brush = model.VALIDATION_BRUSHES[self.is_dark_mode]
 
     def toggle_tv_mode(self):
         self.is_tv_mode = not self.is_tv_mode
@@ -7969,6 +8323,7 @@ class M3UEditorWindow(QMainWindow):
             self.settings.setValue("custom_theme", self.current_theme)
             self.apply_theme(self.current_theme)
             self.is_dark_mode = True # Force dark mode on apply
+            self.update_validation_brushes()
 
     def apply_theme(self, theme):
         app = QApplication.instance()
@@ -7982,6 +8337,12 @@ class M3UEditorWindow(QMainWindow):
 
     def animate_table_refresh(self):
         """Fade animation for the table."""
+        # The opacity effect renders the whole viewport offscreen on every frame,
+        # which gets slow for big playlists; just note the refresh there instead
+        if len(self.entries) > 500:
+            self.status_label.setText("Table refreshed")
+            return
+
         effect = QGraphicsOpacityEffect(self.table)
         self.table.setGraphicsEffect(effect)
         
@@ -7990,6 +8351,8 @@ class M3UEditorWindow(QMainWindow):
         self.anim.setStartValue(0)
         self.anim.setEndValue(1)
         self.anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        # Remove the effect afterwards so the table goes back to direct painting
+        self.anim.finished.connect(lambda: self.table.setGraphicsEffect(None))
         self.anim.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
 
     def toggle_favorites_filter(self, checked):
@@ -8001,18 +8364,16 @@ class M3UEditorWindow(QMainWindow):
         # Usually favoriting doesn't require PIN, but let's leave it open.
         pass
         
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         if not selected_rows: return
             
         self.save_undo_state()
         count = 0
-        for index in selected_rows:
-            source_index = self.proxy_model.mapToSource(index)
-            row = source_index.row()
+        for row in selected_rows:
             entry = self.entries[row]
             entry.favorite = not entry.favorite
             count += 1
-            self.model.dataChanged.emit(source_index, source_index, [Qt.ItemDataRole.DisplayRole])
+        self.model.emit_rows_changed(selected_rows, [Qt.ItemDataRole.DisplayRole])
             
         # self.refresh_table() # Not needed, dataChanged handles it
         # self.update_group_combo() # Not needed as group didn't change
@@ -8094,15 +8455,14 @@ class M3UEditorWindow(QMainWindow):
             new_path = dlg.get_path()
             self.settings.setValue("vlc_path", new_path)
             self.settings.setValue("ffmpeg_dir", dlg.get_ffmpeg_dir())
+            self.vlc_cmd = None
 
     def open_in_vlc(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_source_rows()
         if not selected_rows:
             return
         
-        proxy_index = selected_rows[0]
-        source_index = self.proxy_model.mapToSource(proxy_index)
-        entry = self.entries[source_index.row()]
+        entry = self.entries[selected_rows[0]]
         if not entry:
             return
             
@@ -8110,43 +8470,40 @@ class M3UEditorWindow(QMainWindow):
             if not self.check_pin():
                 return
 
-        # Check settings first
-        vlc_cmd = self.settings.value("vlc_path", "")
-        
-        if not vlc_cmd or not os.path.exists(vlc_cmd):
-            vlc_cmd = "vlc"
-            if sys.platform == "win32":
-                # Check common locations if vlc is not in path
-                possible_paths = [
-                    os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "VideoLAN", "VLC", "vlc.exe"),
-                    os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "VideoLAN", "VLC", "vlc.exe")
-                ]
-                for p in possible_paths:
-                    if os.path.exists(p):
-                        vlc_cmd = p
-                        break
-        
         try:
             if sys.platform == 'darwin':
                  subprocess.Popen(['open', '-a', 'VLC', entry.url])
             else:
-                 subprocess.Popen([vlc_cmd, entry.url])
+                 subprocess.Popen([self.resolve_vlc(), entry.url])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not start VLC: {e}\nEnsure VLC is installed and in your PATH.")
 
+    def resolve_vlc(self):
+        """Returns the VLC executable, looking it up only once per path setting."""
+        if self.vlc_cmd:
+            return self.vlc_cmd
+
+        # Check settings first
+        vlc_cmd = self.settings.value("vlc_path", "")
+        if not vlc_cmd or not os.path.exists(vlc_cmd):
+            vlc_cmd = shutil.which("vlc") or next((p for p in VLC_WINDOWS_PATHS if os.path.exists(p)), None)
+            if not vlc_cmd:
+                # Not found; let Popen report the failure and look again next time
+                return "vlc"
+
+        self.vlc_cmd = vlc_cmd
+        return vlc_cmd
+
     def open_stream_preview(self):
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_rows = self.selected_proxy_rows()
         if not selected_rows:
             return
             
         # Get all entries from the proxy model (the ones currently visible/sorted)
-        visible_entries = []
-        for i in range(self.proxy_model.rowCount()):
-            source_index = self.proxy_model.mapToSource(self.proxy_model.index(i, 0))
-            visible_entries.append(self.entries[source_index.row()])
+        visible_entries = [self.entries[row] for row in self.visible_source_rows()]
             
         # Find the index of the selected row in the visible list
-        current_index = selected_rows[0].row()
+        current_index = selected_rows[0]
         
         entry = visible_entries[current_index]
         if entry.locked:
@@ -8509,7 +8866,7 @@ class M3UEditorWindow(QMainWindow):
         self.monitor_dialog.show()
 
     def open_user_agent_manager(self):
-        groups = list(set(e.group for e in self.entries if e.group))
+        groups = list(set(map(attrgetter('group'), self.entries)) - {""})
         dlg = UserAgentManagerDialog(groups, self.settings, self)
         if dlg.exec():
             ua, target = dlg.get_data()
@@ -8533,6 +8890,7 @@ class M3UEditorWindow(QMainWindow):
                 # Group
                 entries_to_update = [e for e in self.entries if e.group == target]
                 
+            ua = sys.intern(ua)
             for entry in entries_to_update:
                 entry.user_agent = ua
                 count += 1
@@ -8595,6 +8953,7 @@ class M3UEditorWindow(QMainWindow):
         if dlg.exec():
             # Reload settings if needed
             self.epg_urls = self.settings.value("epg_urls", [], type=list)
+            self.vlc_cmd = None
 
     def check_scheduled_tasks(self):
         now = QDateTime.currentDateTime()
@@ -8658,7 +9017,7 @@ class M3UEditorWindow(QMainWindow):
     def run_plugin(self, plugin):
         try:
             logging.info(f"Running plugin: {plugin['name']}")
-            plugin["run"](self)
+            self.plugin_manager.load_plugin(plugin)(self)
         except Exception as e:
             logging.error(f"Error running plugin {plugin['name']}: {e}", exc_info=True)
             QMessageBox.critical(self, "Plugin Error", f"Error running plugin '{plugin['name']}':\n{str(e)}")
@@ -8752,5 +9111,12 @@ if __name__ == "__main__":
     
     window = M3UEditorWindow()
     window.showMaximized()
+
+    # Close the PyInstaller splash screen (only present in frozen builds)
+    try:
+        import pyi_splash
+        pyi_splash.close()
+    except ImportError:
+        pass
     
     sys.exit(app.exec())
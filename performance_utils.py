@@ -1,9 +1,10 @@
 import logging
+import sys
 import time
 import urllib.request
 import urllib.error
 import re
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Iterable
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, QThreadPool, QTimer
 
 # -----------------------------------------------------------------------------
@@ -132,51 +133,81 @@ class EfficientUndoStack:
 # Fast M3U Parser
 # -----------------------------------------------------------------------------
 
+_DURATION_RE = re.compile(r'#EXTINF:([-0-9]+)')
+# (entry key, pattern) for each EXTINF attribute the editor understands
+_ATTR_RES = [
+    (attr.replace("-", "_").replace("group_title", "group"), re.compile(f'{attr}="([^"]*)"'))
+    for attr in ["group-title", "tvg-logo", "tvg-id", "tvg-chno", "tvg-fav", "tvg-health"]
+]
+
 class FastM3UParser:
     """A faster, more robust M3U parser."""
     
     @staticmethod
-    def parse_lines(lines: List[str]) -> List[Dict[str, str]]:
+    def parse_lines(lines: Iterable[str]) -> List[Dict[str, str]]:
         entries = []
         current_entry = {}
+        # Bind the compiled patterns locally to skip global lookups per line
+        match_duration = _DURATION_RE.search
+        attr_res = _ATTR_RES
+        # Groups, durations and user agents repeat across most of a playlist;
+        # interning shares one string object per distinct value
+        intern = sys.intern
         
         for line in lines:
             line = line.strip()
             if not line: continue
-            if line.startswith("#EXTM3U"): continue
             
-            if line.startswith("#EXTINF:"):
+            # URL lines are the most common, so check the first character before
+            # any prefix comparison; other directives (#EXTM3U etc.) fall through
+            if line[0] != "#":
+                if current_entry:
+                    current_entry["url"] = line
+                    entries.append(current_entry)
+                    current_entry = {}
+                else:
+                    entries.append({"name": "Unknown", "url": line})
+            
+            elif line.startswith("#EXTINF:"):
                 # Fast attribute extraction without heavy regex
                 current_entry = {"raw_extinf": line}
                 
-                # Split by comma for name
-                parts = line.split(",", 1)
-                if len(parts) > 1:
-                    current_entry["name"] = parts[1].strip()
+                # The name follows the first comma outside a quoted attribute
+                # value, so titles and group names may both contain commas
+                comma = line.find(",", 8)
+                while comma >= 0 and line.count('"', 8, comma) % 2:
+                    comma = line.find(",", comma + 1)
+                if comma >= 0:
+                    current_entry["name"] = line[comma + 1:].strip()
+                    head = line[8:comma]
+                else:
+                    head = line[8:]
                 
-                # Extract attributes from the first part
-                attr_part = parts[0]
-                # Extract duration
-                dur_match = re.search(r'#EXTINF:([-0-9]+)', attr_part)
-                if dur_match:
-                    current_entry["duration"] = dur_match.group(1)
+                # The duration is usually the leading token of the head; anything
+                # else (no duration, "1.5", ...) goes through the regex
+                tokens = head.split(None, 1)
+                duration = tokens[0] if tokens else ""
+                digits = duration.lstrip("-")
+                # isdigit() alone would also accept "²" and other non-ASCII digits
+                if digits.isascii() and digits.isdigit():
+                    current_entry["duration"] = intern(duration)
+                else:
+                    dur_match = match_duration(line, 0, comma if comma >= 0 else len(line))
+                    if dur_match:
+                        current_entry["duration"] = dur_match.group(1)
                 
-                # Extract other attributes using a simpler regex or string splitting
-                for attr in ["group-title", "tvg-logo", "tvg-id", "tvg-chno", "tvg-fav", "tvg-health"]:
-                    match = re.search(f'{attr}="([^"]*)"', attr_part)
-                    if match:
-                        current_entry[attr.replace("-", "_").replace("group_title", "group")] = match.group(1)
+                # Extract other attributes from the (short) attribute part only;
+                # they may come in any order and without a leading duration
+                if "=" in head:
+                    for key, attr_re in attr_res:
+                        match = attr_re.search(head)
+                        if match:
+                            current_entry[key] = match.group(1)
+                    if "group" in current_entry:
+                        current_entry["group"] = intern(current_entry["group"])
             
             elif line.startswith("#EXTVLCOPT:"):
                 if "http-user-agent=" in line.lower():
-                    current_entry["user_agent"] = line.split("=", 1)[1].strip()
-            
-            elif not line.startswith("#"):
-                if current_entry:
-                    current_entry["url"] = line
-                    entries.append(current_entry)
-                    current_entry = {}
-                else:
-                    entries.append({"name": "Unknown", "url": line})
+                    current_entry["user_agent"] = intern(line.split("=", 1)[1].strip())
                     
         return entries